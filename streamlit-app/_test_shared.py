@@ -0,0 +1,206 @@
+"""Shared helpers for the top-level validation scripts.
+
+test_app_structure.py, test_phase1_5.py and test_api_client.py import this
+module so that app.py is read and parsed, and each required directory is
+listed, at most once per process no matter how many scripts use them. The
+Team 1/2 testers share the import probe, the team scripts write their
+reports through write_file, and scripts that run independent
+sections concurrently use ThreadLocalStdout to keep each section's output
+together.
+
+Attributes:
+    APP_SRC: Source text of app.py (loaded on first access)
+    APP_AST: Parsed module AST of app.py (loaded on first access)
+"""
+
+import ast
+import importlib
+import io
+import os
+import sys
+import threading
+from collections import defaultdict
+from contextlib import redirect_stdout
+from functools import lru_cache, wraps
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+APP_PATH = BASE_DIR / "app.py"
+
+
+@lru_cache(maxsize=None)
+def load_source():
+    """Read app.py once.
+
+    Returns:
+        Source text of app.py
+    """
+    return APP_PATH.read_bytes().decode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def load_app():
+    """Read and parse app.py once for every structure check.
+
+    The syntax check and the AST-based checks share this single parse; a
+    separate bytecode compile just to detect SyntaxError would be a second
+    pass over the same source.
+
+    Returns:
+        Tuple of (source, module AST)
+
+    Raises:
+        SyntaxError: If app.py is not valid Python
+    """
+    source = load_source()
+    tree = compile(source, str(APP_PATH), 'exec', ast.PyCF_ONLY_AST, dont_inherit=True)
+    return source, tree
+
+
+def __getattr__(name):
+    # Lazy module attributes so importing never fails on a broken app.py
+    if name == "APP_SRC":
+        return load_source()
+    if name == "APP_AST":
+        return load_app()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def list_dir(path):
+    """Return the entry names in ``path`` (empty if it does not exist)."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except FileNotFoundError:
+        return frozenset()
+
+
+def missing_files(base_path, required_files):
+    """Return the subset of ``required_files`` absent under ``base_path``.
+
+    Files are grouped by parent directory so each directory is listed once
+    instead of stat-ing every path individually.
+    """
+    by_dir = defaultdict(set)
+    for file_path in required_files:
+        by_dir[os.path.dirname(file_path)].add(os.path.basename(file_path))
+
+    missing = set()
+    for parent, needed in by_dir.items():
+        for name in needed - list_dir(str(Path(base_path) / parent)):
+            missing.add(os.path.join(parent, name))
+    return missing
+
+
+def buffered_output(test_func):
+    """Collect a test's printed output and emit it with a single write."""
+    @wraps(test_func)
+    def wrapper():
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return test_func()
+        finally:
+            sys.stdout.write(buffer.getvalue())
+    return wrapper
+
+
+def write_file(path, data):
+    """Write bytes straight to a fd, bypassing the TextIOWrapper layer.
+
+    os.write may write fewer bytes than asked, so it is called until the
+    whole buffer is out.
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Import errors already seen in this process, so failures are not retried
+_FAILED_IMPORTS = {}
+
+
+def cached_import(name):
+    """Import a module, consulting sys.modules and earlier failures first"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    error = _FAILED_IMPORTS.get(name)
+    if error is not None:
+        raise error
+    try:
+        return importlib.import_module(name)
+    except Exception as e:
+        _FAILED_IMPORTS[name] = e
+        raise
+
+
+def probe_import(module_name):
+    """Import a module, catching any failure.
+
+    The handler is deliberately broad: a module body can raise anything
+    while it executes, and each failure is reported rather than aborting
+    the caller's run.
+
+    Returns:
+        Tuple of (module name, "PASS"/"FAIL", error message)
+    """
+    try:
+        cached_import(module_name)
+        return module_name, "PASS", ""
+    except Exception as e:
+        return module_name, "FAIL", str(e)
+
+
+def probe_imports(modules, mapper=map):
+    """Probe imports, sharing sys.modules and earlier failures in this process.
+
+    Every module that has not been imported yet in this process is really
+    imported, so a PASS always reflects the current interpreter and sources.
+
+    Args:
+        modules: Module names to import
+        mapper: map-like callable used to run probe_import over the modules
+
+    Returns:
+        List of (module name, "PASS"/"FAIL", error message) in input order
+    """
+    return list(mapper(probe_import, modules))
+
+
+class ThreadLocalStdout:
+    """stdout proxy that routes writes to a per-thread buffer when one is set.
+
+    Lets independent tests run concurrently while each keeps its banner and
+    output together instead of interleaving line by line.
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self._local = threading.local()
+
+    def write(self, text):
+        return getattr(self._local, 'buffer', self.default).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self.default).flush()
+
+    def run_buffered(self, test_func):
+        """Run ``test_func`` capturing this thread's output.
+
+        Returns:
+            Tuple of (test result, captured output)
+        """
+        self._local.buffer = buffer = io.StringIO()
+        try:
+            return test_func(), buffer.getvalue()
+        except BaseException:
+            self.default.write(buffer.getvalue())
+            raise
+        finally:
+            del self._local.buffer
@@ -33,6 +33,31 @@ _PLOTLY_LAYOUT = dict(
 )
 
 
+# Run-option lists kept; every append to the log changes the cache key
+_RUN_OPTIONS_CACHE_ENTRIES = 4
+
+
+@st.cache_data(show_spinner=False, max_entries=_RUN_OPTIONS_CACHE_ENTRIES)
+def _run_options(log_path: str, mtime_ns: int) -> tuple:
+    """Return ``((run_id, label), ...)`` for every stored run, newest-first.
+
+    Cached on the log's mtime so run selectors skip re-parsing the log and
+    re-formatting labels on reruns where the file has not changed. An
+    immutable tuple keeps the cache hit cheap.
+    """
+    return tuple((r.run_id, r.label) for r in DelegationParser(log_path).list_runs())
+
+
+def _current_run_options() -> tuple:
+    """Return the cached run options for the default delegation log."""
+    log_path = DelegationParser().log_file
+    try:
+        mtime_ns = os.stat(log_path).st_mtime_ns
+    except OSError:
+        return ()
+    return _run_options(log_path, mtime_ns)
+
+
 def _collect_all_nodes(parser: DelegationParser, run_id: Optional[str] = None) -> List[DelegationNode]:
     """Return a flat list of all delegation nodes, optionally filtered by run."""
     roots = parser.parse_delegation_tree(run_id)
@@ -309,6 +334,8 @@ def _prune_runs(log_path: str, keep: int) -> tuple:
     Reads every line, groups events by run_id, sorts runs newest-first
     by earliest timestamp, then atomically rewrites the file retaining
     only the `keep` most recent runs.  Events with no run_id are preserved.
+    Kept events are written back as their original bytes rather than
+    re-serialized; blank and unparseable lines are dropped.
 
     Returns (pruned_run_count, removed_event_count, kept_event_count).
     Returns (0, 0, 0) when the file does not exist or is empty.
@@ -316,46 +343,44 @@ def _prune_runs(log_path: str, keep: int) -> tuple:
     if not os.path.exists(log_path):
         return 0, 0, 0
 
+    # (run_id, raw line) per parsed event, in file order
     events = []
-    with open(log_path, "r") as f:
+    # Determine first-seen timestamp per run_id (ISO-8601 strings compare correctly).
+    run_first_ts: dict = {}
+    with open(log_path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
-                pass
+                ev = json.loads(line)
+            except ValueError:
+                continue
+            rid = ev.get("run_id")
+            events.append((rid, line))
+            if not rid:
+                continue
+            ts = ev.get("timestamp", "")
+            if ts and (rid not in run_first_ts or ts < run_first_ts[rid]):
+                run_first_ts[rid] = ts
 
     if not events:
         return 0, 0, 0
 
-    # Determine first-seen timestamp per run_id (ISO-8601 strings compare correctly).
-    run_first_ts: dict = {}
-    for ev in events:
-        rid = ev.get("run_id")
-        if not rid:
-            continue
-        ts = ev.get("timestamp", "")
-        if ts and (rid not in run_first_ts or ts < run_first_ts[rid]):
-            run_first_ts[rid] = ts
-
     # Sort newest-first (descending ISO timestamp).
-    sorted_runs = sorted(run_first_ts.keys(), key=lambda r: run_first_ts[r], reverse=True)
-    total_runs = len(sorted_runs)
+    sorted_runs = sorted(run_first_ts, key=run_first_ts.__getitem__, reverse=True)
 
-    if total_runs <= keep:
+    if len(sorted_runs) <= keep:
         return 0, 0, len(events)
 
     prune_ids = set(sorted_runs[keep:])
-    kept = [e for e in events if e.get("run_id", "") not in prune_ids]
+    kept = [line for rid, line in events if not rid or rid not in prune_ids]
     removed = len(events) - len(kept)
 
     # Atomic write: write to .tmp sibling, then rename over original.
     tmp_path = log_path + ".tmp"
-    with open(tmp_path, "w") as f:
-        for ev in kept:
-            f.write(json.dumps(ev) + "\n")
+    with open(tmp_path, "wb") as f:
+        f.write(b"\n".join(kept) + b"\n" if kept else b"")
     os.replace(tmp_path, log_path)
 
     return len(prune_ids), removed, len(kept)
@@ -5268,33 +5293,34 @@ def render_run_diff() -> None:
     st.markdown("#### Run Comparison")
 
     parser = DelegationParser()
-    runs = parser.list_runs()
+    run_opts = _current_run_options()
 
-    if len(runs) < 2:
+    if len(run_opts) < 2:
         st.caption("Fewer than 2 runs available.")
         return
 
     # ── Run pair selectors ─────────────────────────────────────────────────
-    options = [r.label for r in runs]
+    labels = dict(run_opts)
+    options = [rid for rid, _ in run_opts]
     sel_col1, sel_col2 = st.columns(2)
     with sel_col1:
-        label_a = st.selectbox(
+        run_a_id = st.selectbox(
             "Baseline (A)",
             options=options,
             index=0,
+            format_func=labels.get,
             key="delegation_diff_run_a",
             help="Baseline run for comparison",
         )
     with sel_col2:
-        label_b = st.selectbox(
+        run_b_id = st.selectbox(
             "Compare (B)",
             options=options,
             index=min(1, len(options) - 1),
+            format_func=labels.get,
             key="delegation_diff_run_b",
             help="Run to compare against the baseline",
         )
-    run_a_id = next((r.run_id for r in runs if r.label == label_a), None)
-    run_b_id = next((r.run_id for r in runs if r.label == label_b), None)
     run_a_label = f"A [{run_a_id[:8]}…]" if run_a_id else "A"
     run_b_label = f"B [{run_b_id[:8]}…]" if run_b_id else "B"
 
@@ -5566,18 +5592,18 @@ def render_run_selector() -> Optional[str]:
         The selected run_id string, or None when 'All runs' is chosen
         or when the log is empty.
     """
-    parser = DelegationParser()
-    runs = parser.list_runs()
-    if not runs:
+    run_opts = _current_run_options()
+    if not run_opts:
         return None
 
-    labels = [r.label for r in runs]
-    options = ["All runs"] + labels
+    labels = dict(run_opts)
+    options = [None] + [rid for rid, _ in run_opts]
 
     selected = st.selectbox(
         "Filter by run",
         options=options,
         index=1 if len(options) > 1 else 0,  # default: most recent run
+        format_func=lambda rid: "All runs" if rid is None else labels[rid],
         key="delegation_shared_run_selector",
         help=(
             "Sync the timeline, summary, and delegation tree to a single "
@@ -5586,10 +5612,4 @@ def render_run_selector() -> Optional[str]:
         ),
     )
 
-    if selected == "All runs":
-        return None
-
-    for run in runs:
-        if run.label == selected:
-            return run.run_id
-    return None
+    return selected
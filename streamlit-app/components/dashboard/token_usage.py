@@ -44,8 +44,9 @@ def render() -> None:
 
     # Get token data
     try:
-        summary = costs_parser.get_cost_summary()
-        token_history = costs_parser.get_token_history(hours=24)
+        snapshot = costs_parser.snapshot(hours=24)
+        summary = snapshot.summary
+        token_history = snapshot.history
     except Exception as e:
         st.error(f"Failed to load token data: {str(e)}")
         return
@@ -0,0 +1,21 @@
+"""Fixtures shared by the pytest-collected test scripts."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def process_monitor():
+    """One ProcessMonitor for the whole run.
+
+    Imported here rather than at module level, so a missing optional
+    dependency only fails the tests that list processes instead of
+    breaking collection of the whole suite.
+    """
+    from lib.process_monitor import ProcessMonitor
+    return ProcessMonitor()
+
+
+@pytest.fixture(scope="session")
+def process_list(process_monitor):
+    """Enumerate processes once; walking /proc is the slowest step in the suite."""
+    return process_monitor.list_all_processes()
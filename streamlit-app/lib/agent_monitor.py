@@ -9,6 +9,18 @@ import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def _format_display_name(name: str, model: str, is_default: bool) -> str:
+    """Format an agent display name; pure, so memoized per (name, model)."""
+    # Extract short model name (last part after /)
+    model_short = model.split("/")[-1] if "/" in model else model
+
+    if is_default:
+        return f"{name} ({model_short}) ⭐"
+    return f"{name} ({model_short})"
 
 
 class AgentMonitor:
@@ -214,15 +226,11 @@ class AgentMonitor:
         Returns:
             Formatted display name like "default (claude-sonnet-4)" or "researcher (gpt-4)"
         """
-        name = agent.get("name", "unknown")
-        model = agent.get("model", "unknown")
-
-        # Extract short model name (last part after /)
-        model_short = model.split("/")[-1] if "/" in model else model
-
-        if agent.get("is_default"):
-            return f"{name} ({model_short}) ⭐"
-        return f"{name} ({model_short})"
+        return _format_display_name(
+            agent.get("name", "unknown"),
+            agent.get("model", "unknown"),
+            bool(agent.get("is_default")),
+        )
 
 
 # Module-level singleton instance
@@ -20,6 +20,7 @@ Example usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
@@ -42,6 +43,12 @@ class ZeroClawAPIClient:
         self.api_token = api_token
         self.session = requests.Session()
 
+        # Keep a small pool of persistent connections to the gateway so
+        # consecutive calls reuse one socket instead of reconnecting
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Set default timeout for all requests
         self.session.request = lambda *args, **kwargs: requests.Session.request(
             self.session, *args, **{**kwargs, 'timeout': kwargs.get('timeout', 30)}
@@ -53,6 +60,7 @@ class ZeroClawAPIClient:
 
         # Set common headers
         self.session.headers['User-Agent'] = 'ZeroClaw-Streamlit-Client/1.0'
+        self.session.headers['Connection'] = 'keep-alive'
 
     def get_health(self) -> Dict[str, Any]:
         """Check gateway health status.
@@ -3,9 +3,10 @@
 Logs all tool approval decisions for security audit trail.
 """
 
+import io
 import json
 import os
-from typing import Dict, Any, Optional, List
+from typing import IO, Callable, Dict, Any, Optional, List, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import logging
@@ -29,16 +30,26 @@ class AuditEntry:
 class AuditLogger:
     """Logs tool approval and execution events."""
 
-    def __init__(self, log_file: str = "~/.zeroclaw/state/audit.jsonl"):
+    def __init__(self, log_file: str = "~/.zeroclaw/state/audit.jsonl",
+                 stream: Optional[IO] = None,
+                 json_dumps: Optional[Callable[[Any], Union[str, bytes]]] = None):
         """Initialize audit logger.
 
         Args:
             log_file: Path to audit log file
+            stream: Optional open text or binary stream that receives
+                entries instead of log_file (e.g. io.BytesIO in tests).
+                Read methods still use log_file.
+            json_dumps: Serializer for entries, returning str or UTF-8
+                bytes (e.g. orjson.dumps). Defaults to json.dumps.
         """
         self.log_file = os.path.expanduser(log_file)
+        self.stream = stream
+        self.json_dumps = json_dumps or json.dumps
 
         # Ensure directory exists
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+        if stream is None:
+            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
 
     def log_approval(self, tool_name: str, parameters: Dict[str, Any],
                      approver: str, approved: bool, reason: Optional[str] = None):
@@ -121,7 +132,7 @@ class AuditLogger:
         entries = []
 
         try:
-            with open(self.log_file, 'r') as f:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
                         try:
@@ -221,11 +232,23 @@ class AuditLogger:
             entry: AuditEntry to write
         """
         try:
-            with open(self.log_file, 'a') as f:
-                data = asdict(entry)
-                # Convert datetime to ISO format
-                data['timestamp'] = entry.timestamp.isoformat()
-                f.write(json.dumps(data) + '\n')
+            data = asdict(entry)
+            # Convert datetime to ISO format
+            data['timestamp'] = entry.timestamp.isoformat()
+            encoded = self.json_dumps(data)
+
+            if isinstance(self.stream, io.TextIOBase):
+                if isinstance(encoded, bytes):
+                    encoded = encoded.decode('utf-8')
+                self.stream.write(encoded + '\n')
+            else:
+                if isinstance(encoded, str):
+                    encoded = encoded.encode('utf-8')
+                if self.stream is not None:
+                    self.stream.write(encoded + b'\n')
+                else:
+                    with open(self.log_file, 'ab') as f:
+                        f.write(encoded + b'\n')
 
             logger.info(f"Logged audit event: {entry.event_type} - {entry.tool_name}")
 
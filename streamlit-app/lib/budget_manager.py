@@ -112,18 +112,39 @@ class BudgetManager:
             }
         """
         if not self.is_enabled():
-            return {
-                "status": BudgetStatus.DISABLED,
-                "current_usd": 0.0,
-                "limit_usd": 0.0,
-                "percent_used": 0.0,
-                "message": "Cost tracking is disabled in config.toml"
-            }
+            return self._disabled_check()
 
-        # Get cost summary
-        summary = self.costs_parser.get_cost_summary()
-        limits = self.get_limits()
+        return self._evaluate_budget(
+            period, self.costs_parser.get_cost_summary(), self.get_limits()
+        )
+
+    @staticmethod
+    def _disabled_check() -> Dict[str, Any]:
+        """Budget check result used while cost tracking is disabled."""
+        return {
+            "status": BudgetStatus.DISABLED,
+            "current_usd": 0.0,
+            "limit_usd": 0.0,
+            "percent_used": 0.0,
+            "message": "Cost tracking is disabled in config.toml"
+        }
+
+    @staticmethod
+    def _evaluate_budget(
+        period: Literal["daily", "monthly"],
+        summary: Dict[str, Any],
+        limits: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Compare a cost summary against the configured limits.
 
+        Args:
+            period: Either "daily" or "monthly"
+            summary: Result of CostsParser.get_cost_summary()
+            limits: Result of get_limits()
+
+        Returns:
+            Budget check result (see check_budget)
+        """
         # Select period
         if period == "daily":
             current = summary["daily_cost_usd"]
@@ -172,28 +193,30 @@ class BudgetManager:
                 "limits": { daily_limit_usd, monthly_limit_usd, warn_at_percent }
             }
         """
+        limits = self.get_limits()
+
         if not self.is_enabled():
             return {
                 "enabled": False,
-                "daily": self.check_budget("daily"),
-                "monthly": self.check_budget("monthly"),
+                "daily": self._disabled_check(),
+                "monthly": self._disabled_check(),
                 "session": {"cost_usd": 0.0, "tokens": 0, "requests": 0},
-                "limits": self.get_limits()
+                "limits": limits
             }
 
-        # Get cost summary
+        # Get cost summary once and evaluate both periods against it
         summary = self.costs_parser.get_cost_summary()
 
         return {
             "enabled": True,
-            "daily": self.check_budget("daily"),
-            "monthly": self.check_budget("monthly"),
+            "daily": self._evaluate_budget("daily", summary, limits),
+            "monthly": self._evaluate_budget("monthly", summary, limits),
             "session": {
                 "cost_usd": summary["session_cost_usd"],
                 "tokens": summary["total_tokens"],
                 "requests": summary["request_count"]
             },
-            "limits": self.get_limits()
+            "limits": limits
         }
 
     def get_status_color(self, status: BudgetStatus) -> str:
@@ -10,11 +10,30 @@ This module provides persistent storage for conversations:
 
 import json
 import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import uuid
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialise to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 class ConversationManager:
     """Manages conversation persistence to filesystem.
@@ -51,20 +70,40 @@ class ConversationManager:
         Returns:
             Dict mapping conversation_id to metadata
         """
-        if self.index_file.exists():
-            try:
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading conversation index: {e}")
-                return {}
-        return {}
+        try:
+            return _read_json(self.index_file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading conversation index: {e}")
+            return {}
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON to a sibling temp file and atomically move it into place.
+
+        The temp file is uniquely named, so concurrent saves of the same
+        file never write into each other's temp file.
+
+        Args:
+            path: Destination file
+            data: JSON-serialisable dict
+        """
+        tmp = tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.name + '.', suffix='.tmp', delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(_dumps(data))
+            os.replace(tmp.name, path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
 
     def _save_index(self) -> None:
         """Save the conversation index to disk."""
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(self.index, f, indent=2, ensure_ascii=False)
+            self._write_json(self.index_file, self.index)
         except Exception as e:
             print(f"Error saving conversation index: {e}")
 
@@ -126,8 +165,7 @@ class ConversationManager:
         # Save conversation file
         conv_file = self.storage_dir / f"{conversation_id}.json"
         try:
-            with open(conv_file, 'w', encoding='utf-8') as f:
-                json.dump(conversation, f, indent=2, ensure_ascii=False)
+            self._write_json(conv_file, conversation)
         except Exception as e:
             raise IOError(f"Failed to save conversation: {e}")
 
@@ -156,12 +194,10 @@ class ConversationManager:
         """
         conv_file = self.storage_dir / f"{conversation_id}.json"
 
-        if not conv_file.exists():
-            return None
-
         try:
-            with open(conv_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(conv_file)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading conversation {conversation_id}: {e}")
             return None
@@ -213,15 +249,14 @@ class ConversationManager:
             self._save_index()
 
         # Delete file
-        if conv_file.exists():
-            try:
-                conv_file.unlink()
-                return True
-            except Exception as e:
-                print(f"Error deleting conversation {conversation_id}: {e}")
-                return False
-
-        return False
+        try:
+            conv_file.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error deleting conversation {conversation_id}: {e}")
+            return False
 
     def get_storage_path(self) -> str:
         """Get the storage directory path.
@@ -289,7 +324,7 @@ class ConversationManager:
             return None
 
         if format == "json":
-            return json.dumps(conversation, indent=2, ensure_ascii=False)
+            return _dumps(conversation).decode('utf-8')
 
         elif format == "markdown":
             lines = [
@@ -18,10 +18,121 @@ Each line in the file is a JSON record representing a single API request:
 
 import json
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _loads = json.loads
+
+# Maximum number of data points returned by get_token_history()
+TOKEN_HISTORY_LIMIT = 1000
+
+
+# Parsed records are cached per file until the cached files' combined size
+# exceeds this many bytes; a larger file is streamed on every read instead
+RECORD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# path -> (mtime_ns, size, records), least recently used first
+_record_cache: "OrderedDict[str, Tuple[int, int, tuple]]" = OrderedDict()
+_record_cache_lock = threading.Lock()
+
+
+def _iter_lines(f) -> Iterator[Dict[str, Any]]:
+    """Parse an open costs file line by line, closing it when exhausted.
+
+    Yields:
+        Cost record dictionaries (invalid lines skipped)
+    """
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except ValueError:
+                # Skip invalid lines
+                continue
+
+
+def _load_records(path: str, mtime_ns: int, size: int) -> Iterable[Dict[str, Any]]:
+    """Return the records of a costs file, reusing an unchanged parse.
+
+    Entries are keyed per path on (mtime_ns, size), so any write invalidates
+    them, and evicted least recently used first once the cached files total
+    more than RECORD_CACHE_MAX_BYTES. A file larger than that is never held
+    in memory: it is streamed line by line instead. Cached dicts are shared
+    and must not be mutated; public accessors hand out copies.
+
+    Returns:
+        Tuple of cost record dictionaries, or a one-shot stream of them for
+        files over RECORD_CACHE_MAX_BYTES (invalid lines skipped)
+
+    Raises:
+        OSError: If the file can't be opened
+    """
+    with _record_cache_lock:
+        entry = _record_cache.get(path)
+        if entry is not None and entry[:2] == (mtime_ns, size):
+            _record_cache.move_to_end(path)
+            return entry[2]
+
+    f = open(path, 'rb')
+    if size > RECORD_CACHE_MAX_BYTES:
+        return _iter_lines(f)
+    records = tuple(_iter_lines(f))
+
+    with _record_cache_lock:
+        _record_cache.pop(path, None)
+        _record_cache[path] = (mtime_ns, size, records)
+        cached_bytes = sum(e[1] for e in _record_cache.values())
+        while cached_bytes > RECORD_CACHE_MAX_BYTES:
+            _, evicted = _record_cache.popitem(last=False)
+            cached_bytes -= evicted[1]
+    return records
+
+
+def _copy_record(record: Any) -> Any:
+    """Copy a cached record so callers can't mutate the shared parse."""
+    return dict(record) if isinstance(record, dict) else record
+
+
+def _new_totals() -> Dict[str, Any]:
+    """Return an empty per-session accumulator."""
+    return {
+        "cost_usd": 0.0,
+        "tokens": 0,
+        "requests": 0,
+        "by_model": defaultdict(lambda: {"cost_usd": 0.0, "tokens": 0, "requests": 0}),
+    }
+
+
+def _history_points(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Project cost records onto the fields used for token graphs."""
+    return [
+        {
+            "timestamp": r.get('timestamp'),
+            "input_tokens": r.get('input_tokens', 0),
+            "output_tokens": r.get('output_tokens', 0),
+            "total_tokens": r.get('total_tokens', 0),
+            "cost_usd": r.get('cost_usd', 0.0)
+        }
+        for r in records
+    ]
+
+
+@dataclass
+class CostSnapshot:
+    """Summary, recent records and token history from a single file pass."""
+    summary: Dict[str, Any]
+    recent: List[Dict[str, Any]]
+    history: List[Dict[str, Any]]
 
 
 class CostsParser:
@@ -43,13 +154,50 @@ class CostsParser:
 
         self.costs_file = Path(costs_file)
 
+    def _stat(self) -> Optional[os.stat_result]:
+        """Stat the costs file once, or return None if it doesn't exist."""
+        try:
+            return os.stat(self.costs_file)
+        except OSError:
+            return None
+
     def file_exists(self) -> bool:
         """Check if the costs file exists.
 
         Returns:
             True if file exists, False otherwise
         """
-        return self.costs_file.exists()
+        return self._stat() is not None
+
+    def _records(self) -> Iterable[Dict[str, Any]]:
+        """Return the records for the costs file, cached where it fits.
+
+        A single stat gives the cache key; the file is only re-parsed when
+        its mtime or size has changed since the last read. The records are
+        shared with the cache, so callers must copy before handing them out.
+
+        Returns:
+            Records to iterate once; empty if the file doesn't exist or
+            can't be read
+        """
+        stat = self._stat()
+        if stat is None:
+            return ()
+
+        try:
+            return _load_records(str(self.costs_file), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return ()
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over cost records from the file.
+
+        Yields:
+            Copies of the cost record dictionaries; invalid lines are skipped
+            and nothing is yielded if the file doesn't exist or can't be read
+        """
+        for record in self._records():
+            yield _copy_record(record)
 
     def read_all_records(self) -> List[Dict[str, Any]]:
         """Read all cost records from the file.
@@ -58,96 +206,78 @@ class CostsParser:
             List of cost record dictionaries
             Returns empty list if file doesn't exist or is invalid
         """
-        if not self.file_exists():
-            return []
-
-        records = []
         try:
-            with open(self.costs_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        records.append(record)
-                    except json.JSONDecodeError:
-                        # Skip invalid lines
-                        continue
+            return list(self.iter_records())
         except Exception:
             # If file can't be read, return empty list
             return []
 
-        return records
-
-    def get_cost_summary(self, session_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get aggregated cost summary.
+    def _scan(
+        self,
+        session_id: Optional[str],
+        hours: float,
+        window: Optional[int]
+    ) -> Tuple[Dict[str, Any], deque]:
+        """Aggregate the summary and the recent-record window in one pass.
 
         Args:
-            session_id: Optional session ID to filter by. If None, uses most recent session.
+            session_id: Session to summarise, or None for the most recent one
+            hours: Look-back for the recent-record window
+            window: Maximum number of recent records to keep, or None for all
 
         Returns:
-            Dictionary with cost summary:
-            {
-                "session_cost_usd": float,
-                "daily_cost_usd": float,
-                "monthly_cost_usd": float,
-                "total_tokens": int,
-                "request_count": int,
-                "by_model": {
-                    "model_name": {
-                        "cost_usd": float,
-                        "tokens": int,
-                        "requests": int
-                    }
-                }
-            }
+            Tuple of (cost summary dict, deque of the last ``window`` records
+            within the look-back, oldest first; the records are shared with
+            the cache)
         """
-        records = self.read_all_records()
-
-        if not records:
-            return {
-                "session_cost_usd": 0.0,
-                "daily_cost_usd": 0.0,
-                "monthly_cost_usd": 0.0,
-                "total_tokens": 0,
-                "request_count": 0,
-                "by_model": {}
-            }
-
         # Get current time boundaries
         now = datetime.utcnow()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        cutoff = now - timedelta(hours=hours)
 
-        # If no session_id specified, use the most recent one
-        if session_id is None and records:
-            session_id = records[-1].get('session_id')
-
-        # Aggregate costs
-        session_cost = 0.0
+        # Aggregate costs in one pass over the records (cached, or streamed
+        # from disk for files too large to cache). When no session_id is given
+        # the most recent session is only known at the end, so totals are
+        # kept per session and the last one seen is picked afterwards.
         daily_cost = 0.0
         monthly_cost = 0.0
-        total_tokens = 0
-        session_requests = 0
-        by_model = defaultdict(lambda: {"cost_usd": 0.0, "tokens": 0, "requests": 0})
+        sessions: Dict[Any, Dict[str, Any]] = {}
+        last_session = None
+        # Window of the last `window` matching records (all when None)
+        recent: deque = deque(maxlen=window)
 
-        for record in records:
+        for record in self._records():
+            last_session = record.get('session_id') if isinstance(record, dict) else None
             try:
                 timestamp = datetime.fromisoformat(record['timestamp'].replace('Z', '+00:00'))
+            except (AttributeError, KeyError, ValueError, TypeError):
+                # Skip invalid records
+                continue
+
+            try:
+                if timestamp >= cutoff:
+                    recent.append(record)
+            except TypeError:
+                pass
+
+            try:
                 cost = float(record.get('cost_usd', 0.0))
                 tokens = int(record.get('total_tokens', 0))
                 model = record.get('model', 'unknown')
                 rec_session = record.get('session_id')
 
                 # Session totals
-                if rec_session == session_id:
-                    session_cost += cost
-                    total_tokens += tokens
-                    session_requests += 1
-                    by_model[model]["cost_usd"] += cost
-                    by_model[model]["tokens"] += tokens
-                    by_model[model]["requests"] += 1
+                if session_id is None or rec_session == session_id:
+                    totals = sessions.get(rec_session)
+                    if totals is None:
+                        totals = sessions[rec_session] = _new_totals()
+                    totals["cost_usd"] += cost
+                    totals["tokens"] += tokens
+                    totals["requests"] += 1
+                    totals["by_model"][model]["cost_usd"] += cost
+                    totals["by_model"][model]["tokens"] += tokens
+                    totals["by_model"][model]["requests"] += 1
 
                 # Daily totals
                 if timestamp >= today_start:
@@ -157,47 +287,94 @@ class CostsParser:
                 if timestamp >= month_start:
                     monthly_cost += cost
 
-            except (KeyError, ValueError, TypeError):
+            except (AttributeError, KeyError, ValueError, TypeError):
                 # Skip invalid records
                 continue
 
-        return {
-            "session_cost_usd": round(session_cost, 4),
+        # If no session_id specified, use the most recent one
+        if session_id is None:
+            session_id = last_session
+        session = sessions.get(session_id) or _new_totals()
+
+        summary = {
+            "session_cost_usd": round(session["cost_usd"], 4),
             "daily_cost_usd": round(daily_cost, 4),
             "monthly_cost_usd": round(monthly_cost, 4),
-            "total_tokens": total_tokens,
-            "request_count": session_requests,
-            "by_model": dict(by_model)
+            "total_tokens": session["tokens"],
+            "request_count": session["requests"],
+            "by_model": dict(session["by_model"])
         }
+        return summary, recent
 
-    def get_recent_costs(self, hours: int = 24, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get recent cost records.
+    def snapshot(
+        self,
+        hours: int = 24,
+        limit: int = 10,
+        session_id: Optional[str] = None
+    ) -> CostSnapshot:
+        """Get the cost summary, recent costs and token history together.
+
+        Equivalent to calling get_cost_summary(), get_recent_costs() and
+        get_token_history() but reads the records once.
 
         Args:
-            hours: Number of hours to look back
-            limit: Maximum number of records to return
+            hours: Number of hours to look back for recent costs and history
+            limit: Maximum number of recent records to return; 0 or less
+                returns every record in the look-back
+            session_id: Optional session ID for the summary
 
         Returns:
-            List of cost records within the time window, most recent first
+            CostSnapshot with summary, recent (most recent first) and history
         """
-        records = self.read_all_records()
+        unlimited = limit <= 0
+        summary, window = self._scan(
+            session_id, hours, None if unlimited else max(limit, TOKEN_HISTORY_LIMIT)
+        )
+        newest = list(reversed(window))
+        return CostSnapshot(
+            summary=summary,
+            recent=[_copy_record(r) for r in (newest if unlimited else newest[:limit])],
+            history=_history_points(newest[:TOKEN_HISTORY_LIMIT]),
+        )
 
-        if not records:
-            return []
+    def get_cost_summary(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get aggregated cost summary.
 
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-        recent = []
+        Args:
+            session_id: Optional session ID to filter by. If None, uses most recent session.
 
-        for record in records:
-            try:
-                timestamp = datetime.fromisoformat(record['timestamp'].replace('Z', '+00:00'))
-                if timestamp >= cutoff:
-                    recent.append(record)
-            except (KeyError, ValueError, TypeError):
-                continue
+        Returns:
+            Dictionary with cost summary:
+            {
+                "session_cost_usd": float,
+                "daily_cost_usd": float,
+                "monthly_cost_usd": float,
+                "total_tokens": int,
+                "request_count": int,
+                "by_model": {
+                    "model_name": {
+                        "cost_usd": float,
+                        "tokens": int,
+                        "requests": int
+                    }
+                }
+            }
+        """
+        return self._scan(session_id, 0, 0)[0]
+
+    def get_recent_costs(self, hours: int = 24, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get recent cost records.
+
+        Args:
+            hours: Number of hours to look back
+            limit: Maximum number of records to return; 0 or less returns
+                every record in the time window
 
-        # Return most recent first, limited
-        return list(reversed(recent[-limit:]))
+        Returns:
+            List of cost records within the time window, most recent first
+        """
+        window = self._scan(None, hours, limit if limit > 0 else None)[1]
+        return [_copy_record(r) for r in reversed(window)]
 
     def get_token_history(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get token usage history for graphing.
@@ -217,18 +394,8 @@ class CostsParser:
                 }
             ]
         """
-        records = self.get_recent_costs(hours=hours, limit=1000)
-
-        return [
-            {
-                "timestamp": r.get('timestamp'),
-                "input_tokens": r.get('input_tokens', 0),
-                "output_tokens": r.get('output_tokens', 0),
-                "total_tokens": r.get('total_tokens', 0),
-                "cost_usd": r.get('cost_usd', 0.0)
-            }
-            for r in records
-        ]
+        window = self._scan(None, hours, TOKEN_HISTORY_LIMIT)[1]
+        return _history_points(list(reversed(window)))
 
 
 # Module-level singleton instance
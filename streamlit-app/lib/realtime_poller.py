@@ -21,6 +21,8 @@ class RealtimePoller:
         - chat_polling: bool (whether polling is active)
         - chat_last_check: float (timestamp of last poll)
         - chat_poll_interval: int (seconds between polls)
+        - chat_poll_handles: int (consumers currently waiting on a poll)
+        - chat_poll_toggle_handle: bool (the "Enable polling" toggle holds a handle)
         - chat_messages: List[Dict] (conversation messages)
     """
 
@@ -42,6 +44,9 @@ class RealtimePoller:
         if 'chat_waiting_for_response' not in st.session_state:
             st.session_state.chat_waiting_for_response = False
 
+        if 'chat_poll_handles' not in st.session_state:
+            st.session_state.chat_poll_handles = 0
+
     def start_polling(self) -> None:
         """Enable polling."""
         st.session_state.chat_polling = True
@@ -59,13 +64,50 @@ class RealtimePoller:
         """
         return st.session_state.get('chat_polling', False)
 
+    def register(self) -> None:
+        """Register a consumer that needs polling (e.g. a pending response)."""
+        st.session_state.chat_poll_handles = self.active_handles() + 1
+
+    def unregister(self) -> None:
+        """Release a consumer registered with :meth:`register`."""
+        st.session_state.chat_poll_handles = max(0, self.active_handles() - 1)
+
+    def set_toggle_handle(self, enabled: bool) -> None:
+        """Hold or release the handle owned by the "Enable polling" toggle.
+
+        The toggle is a consumer in its own right, so switching it on polls
+        even when nothing else is waiting. Repeated calls with the same
+        value are no-ops.
+
+        Args:
+            enabled: Whether the toggle is on
+        """
+        if enabled == st.session_state.get('chat_poll_toggle_handle', False):
+            return
+        if enabled:
+            self.register()
+        else:
+            self.unregister()
+        st.session_state.chat_poll_toggle_handle = enabled
+
+    def active_handles(self) -> int:
+        """Get the number of registered polling consumers.
+
+        Returns:
+            Count of consumers currently waiting on a poll
+        """
+        return st.session_state.get('chat_poll_handles', 0)
+
     def should_poll_now(self) -> bool:
         """Check if it's time to poll again.
 
+        Polling that is enabled but has no registered consumers stays idle,
+        so reruns skip the clock read and session-state updates entirely.
+
         Returns:
-            True if poll interval has elapsed
+            True if polling is active, has consumers and the interval elapsed
         """
-        if not self.is_polling():
+        if not self.is_polling() or not self.active_handles():
             return False
 
         now = time.time()
@@ -121,11 +163,15 @@ class RealtimePoller:
 
     def mark_waiting_for_response(self) -> None:
         """Mark that we're waiting for an agent response."""
+        if not st.session_state.get('chat_waiting_for_response', False):
+            self.register()
         st.session_state.chat_waiting_for_response = True
         self.start_polling()
 
     def clear_waiting_for_response(self) -> None:
         """Clear the waiting flag."""
+        if st.session_state.get('chat_waiting_for_response', False):
+            self.unregister()
         st.session_state.chat_waiting_for_response = False
         self.stop_polling()
 
@@ -182,6 +228,7 @@ class RealtimePoller:
                     self.start_polling()
                 else:
                     self.stop_polling()
+            self.set_toggle_handle(polling_enabled)
 
             # Interval slider (only if polling enabled)
             if self.is_polling():
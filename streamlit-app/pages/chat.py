@@ -7,7 +7,10 @@ This page integrates all chat components:
 - Realtime polling
 """
 
+import os
+
 import streamlit as st
+from typing import Optional
 from components.chat.message_history import (
     render_message_history,
     clear_message_history,
@@ -47,17 +50,20 @@ def render() -> None:
     conv_manager = ConversationManager()
     poller = RealtimePoller()
 
+    # Bind session state once per run; the input panel appends to this
+    # same list, so it stays current for everything rendered below.
+    messages: list = st.session_state.setdefault('chat_messages', [])
+    st.session_state.setdefault('chat_model', 'claude-sonnet-4-6')
+
     # Render sidebar controls
-    render_sidebar_controls(conv_manager, poller)
+    render_sidebar_controls(conv_manager, poller, messages)
 
     # Main layout: Two columns
     col1, col2 = st.columns([6, 4])
 
-    # Left column: Message history
-    with col1:
-        render_message_history()
-
-    # Right column: Message input
+    # Right column: Message input. Filled before the history column so a
+    # message sent on this run is already in session state when the
+    # history renders, without forcing a second script run.
     with col2:
         message = render_message_input()
 
@@ -65,20 +71,29 @@ def render() -> None:
         if message:
             handle_message_sent(message, poller)
 
+    # Left column: Message history
+    with col1:
+        render_message_history()
+
     # Footer actions
     st.divider()
-    render_footer_actions(conv_manager)
+    render_footer_actions(conv_manager, messages)
+
+    # Title prompt is rendered last so a save request from this run shows it
+    render_title_prompt()
 
 
 def render_sidebar_controls(
     conv_manager: ConversationManager,
-    poller: RealtimePoller
+    poller: RealtimePoller,
+    messages: list
 ) -> None:
     """Render sidebar controls for conversation management and polling.
 
     Args:
         conv_manager: Conversation manager instance
         poller: Realtime poller instance
+        messages: Current conversation messages
     """
     with st.sidebar:
         st.markdown("## 🛠️ Chat Controls")
@@ -93,29 +108,34 @@ def render_sidebar_controls(
 
         # Save current conversation
         if st.button("💾 Save Conversation", use_container_width=True):
-            save_current_conversation(conv_manager)
+            save_current_conversation(conv_manager, messages)
 
         # Load conversation
         render_conversation_loader(conv_manager)
 
         # New conversation
-        if st.button("🆕 New Conversation", use_container_width=True):
-            start_new_conversation()
+        st.button(
+            "🆕 New Conversation",
+            use_container_width=True,
+            on_click=start_new_conversation
+        )
 
         st.divider()
 
         # Statistics
-        render_conversation_stats(conv_manager)
+        render_conversation_stats(conv_manager, messages)
 
 
-def save_current_conversation(conv_manager: ConversationManager) -> None:
+def save_current_conversation(
+    conv_manager: ConversationManager,
+    messages: list
+) -> None:
     """Save the current conversation to disk.
 
     Args:
         conv_manager: Conversation manager instance
+        messages: Current conversation messages
     """
-    messages = st.session_state.get('chat_messages', [])
-
     if not messages:
         st.warning("No messages to save!")
         return
@@ -124,13 +144,13 @@ def save_current_conversation(conv_manager: ConversationManager) -> None:
     title = st.session_state.get('conversation_title', None)
 
     if not title:
+        # Picked up by render_title_prompt() later in this run
         st.session_state.conversation_title_prompt = True
-        st.rerun()
         return
 
     # Save conversation
     try:
-        model = st.session_state.get('chat_model', 'unknown')
+        model = st.session_state.chat_model
         conv_id = conv_manager.save_conversation(
             messages=messages,
             title=title,
@@ -174,13 +194,20 @@ def render_conversation_loader(conv_manager: ConversationManager) -> None:
     if selected_label != "Select..." and selected_label in options:
         conv_id = options[selected_label]
 
-        if st.button("📂 Load", key="load_button"):
-            load_conversation(conv_manager, conv_id)
+        st.button(
+            "📂 Load",
+            key="load_button",
+            on_click=load_conversation,
+            args=(conv_manager, conv_id)
+        )
 
 
 def load_conversation(conv_manager: ConversationManager, conv_id: str) -> None:
     """Load a conversation into the current session.
 
+    Used as a button callback, so the rerun that follows it already
+    reflects the loaded messages.
+
     Args:
         conv_manager: Conversation manager instance
         conv_id: Conversation ID to load
@@ -198,25 +225,30 @@ def load_conversation(conv_manager: ConversationManager, conv_id: str) -> None:
         st.session_state.chat_model = conversation.get('model', 'glm-5')
 
         st.success(f"Loaded: {conversation.get('title', 'Untitled')}")
-        st.rerun()
 
     except Exception as e:
         st.error(f"Error loading conversation: {e}")
 
 
 def start_new_conversation() -> None:
-    """Start a new conversation (clear current messages)."""
+    """Start a new conversation (clear current messages).
+
+    Used as a button callback, so no explicit rerun is needed.
+    """
     st.session_state.chat_messages = []
     st.session_state.current_conversation_id = None
     st.success("Started new conversation!")
-    st.rerun()
 
 
-def render_conversation_stats(conv_manager: ConversationManager) -> None:
+def render_conversation_stats(
+    conv_manager: ConversationManager,
+    messages: list
+) -> None:
     """Render conversation statistics.
 
     Args:
         conv_manager: Conversation manager instance
+        messages: Current conversation messages
     """
     stats = conv_manager.get_stats()
 
@@ -237,7 +269,6 @@ def render_conversation_stats(conv_manager: ConversationManager) -> None:
         )
 
     # Current conversation info
-    messages = st.session_state.get('chat_messages', [])
     if messages:
         st.caption(f"Current: {len(messages)} messages")
 
@@ -262,9 +293,6 @@ def handle_message_sent(message: str, poller: RealtimePoller) -> None:
     # Start polling for real-time updates
     start_waiting_for_response()
 
-    # Rerun to show new message
-    st.rerun()
-
 
 def simulate_agent_response(user_message: str) -> None:
     """Simulate an agent response (placeholder).
@@ -282,28 +310,70 @@ def simulate_agent_response(user_message: str) -> None:
     # Add mock assistant message
     add_assistant_message(
         content=response_content,
-        model=st.session_state.get('chat_model', 'glm-5'),
+        model=st.session_state.chat_model,
         tokens=50,  # Mock token count
         cost=0.001  # Mock cost
     )
 
 
-def render_footer_actions(conv_manager: ConversationManager) -> None:
+# Exports kept per cache; older ones are recomputed on demand
+_EXPORT_CACHE_ENTRIES = 16
+
+
+def _messages_fingerprint(messages: list) -> tuple:
+    """Return a hashable key that changes whenever the messages do."""
+    return tuple(
+        (m.get('id'), m.get('role'), m.get('content', ''))
+        for m in messages
+    )
+
+
+def _saved_file_stamp(conv_manager: ConversationManager, conv_id: str) -> Optional[tuple]:
+    """Return (mtime_ns, size) of a saved conversation file, or None if missing."""
+    try:
+        stat = os.stat(conv_manager.storage_dir / f"{conv_id}.json")
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@st.cache_data(show_spinner=False, max_entries=_EXPORT_CACHE_ENTRIES)
+def _export_text(conv_id: Optional[str], fingerprint: tuple) -> str:
+    """Serialize the current conversation as text, cached per fingerprint."""
+    return export_conversation_text()
+
+
+@st.cache_data(show_spinner=False, max_entries=_EXPORT_CACHE_ENTRIES)
+def _export_json(
+    _conv_manager: ConversationManager,
+    conv_id: str,
+    file_stamp: Optional[tuple]
+) -> Optional[str]:
+    """Serialize a saved conversation as JSON, cached per saved-file stamp."""
+    return _conv_manager.export_conversation(conv_id, format="json")
+
+
+def render_footer_actions(
+    conv_manager: ConversationManager,
+    messages: list
+) -> None:
     """Render footer action buttons.
 
     Args:
         conv_manager: Conversation manager instance
+        messages: Current conversation messages
     """
     col1, col2, col3, col4 = st.columns(4)
+    conv_id = st.session_state.get('current_conversation_id')
 
     with col1:
         if st.button("🗑️ Clear History", use_container_width=True):
-            if st.session_state.get('chat_messages'):
+            if messages:
                 clear_message_history()
 
     with col2:
         if st.button("📥 Export (Text)", use_container_width=True):
-            export_text = export_conversation_text()
+            export_text = _export_text(conv_id, _messages_fingerprint(messages))
             st.download_button(
                 label="Download",
                 data=export_text,
@@ -314,9 +384,10 @@ def render_footer_actions(conv_manager: ConversationManager) -> None:
 
     with col3:
         if st.button("📥 Export (JSON)", use_container_width=True):
-            conv_id = st.session_state.get('current_conversation_id')
             if conv_id:
-                export_json = conv_manager.export_conversation(conv_id, format="json")
+                export_json = _export_json(
+                    conv_manager, conv_id, _saved_file_stamp(conv_manager, conv_id)
+                )
                 if export_json:
                     st.download_button(
                         label="Download",
@@ -327,16 +398,30 @@ def render_footer_actions(conv_manager: ConversationManager) -> None:
                     )
 
     with col4:
-        messages = st.session_state.get('chat_messages', [])
         if messages:
             st.metric("Messages", len(messages))
 
 
-# Handle conversation title input prompt
-if st.session_state.get('conversation_title_prompt'):
+def _set_conversation_title() -> None:
+    """Store the entered title (Save button callback)."""
+    title = st.session_state.get('title_input')
+    if title:
+        st.session_state.conversation_title = title
+
+
+def _cancel_title_prompt() -> None:
+    """Dismiss the title prompt (Cancel button callback)."""
+    st.session_state.conversation_title_prompt = False
+
+
+def render_title_prompt() -> None:
+    """Render the conversation title input prompt when requested."""
+    if not st.session_state.get('conversation_title_prompt'):
+        return
+
     with st.sidebar:
         st.markdown("### 💬 Conversation Title")
-        title = st.text_input(
+        st.text_input(
             "Enter a title:",
             key="title_input",
             placeholder="My Conversation"
@@ -344,12 +429,15 @@ if st.session_state.get('conversation_title_prompt'):
 
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("Save", use_container_width=True):
-                if title:
-                    st.session_state.conversation_title = title
-                    st.rerun()
+            st.button(
+                "Save",
+                use_container_width=True,
+                on_click=_set_conversation_title
+            )
 
         with col2:
-            if st.button("Cancel", use_container_width=True):
-                st.session_state.conversation_title_prompt = False
-                st.rerun()
+            st.button(
+                "Cancel",
+                use_container_width=True,
+                on_click=_cancel_title_prompt
+            )
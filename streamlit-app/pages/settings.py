@@ -7,19 +7,65 @@ This page provides configuration options for:
 """
 
 import streamlit as st
+import hashlib
+import hmac
 import json
 import os
+import re
+import tempfile
+import time
 from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
 from lib.api_client import ZeroClawAPIClient
 from lib.session_state import update_settings
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 # Configuration file path
 CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 
+# URL schemes accepted for the gateway
+_VALID_SCHEMES = ('http://', 'https://')
+
+# Appearance selector options and internal-name <-> display-name maps
+_THEME_OPTIONS = ("Matrix Green", "Dark", "Light")
+_THEME_MAP = {
+    'matrix-green': 'Matrix Green',
+    'dark': 'Dark',
+    'light': 'Light'
+}
+_REVERSE_THEME_MAP = {v: k for k, v in _THEME_MAP.items()}
+
+_FONT_SIZE_OPTIONS = ("Small", "Medium", "Large")
+_FONT_SIZE_MAP = {
+    'small': 'Small',
+    'medium': 'Medium',
+    'large': 'Large'
+}
+_REVERSE_FONT_SIZE_MAP = {v: k for k, v in _FONT_SIZE_MAP.items()}
+
+# A successful health probe is reused for this long (10 seconds)
+HEALTH_FRESH_NS = 10_000_000_000
+
+# Per-process key for fingerprinting the API token in the health cache key,
+# so the token itself never lands in session state
+_TOKEN_FP_KEY = os.urandom(16)
+
+# Session state keys whose values are masked in the debug view
+_SENSITIVE_KEY_RE = re.compile(r'token|secret|password|passwd|api_?key|credential|auth', re.I)
+
 
 def save_settings_to_file() -> None:
-    """Save current settings to JSON file for persistence."""
+    """Save current settings to JSON file for persistence.
+
+    Skips the write when the serialized settings match the last payload
+    written this session.
+    """
     settings = {
         'gateway_url': st.session_state.gateway_url,
         'api_token': st.session_state.api_token,
@@ -29,28 +75,110 @@ def save_settings_to_file() -> None:
         'auto_refresh': st.session_state.auto_refresh
     }
 
+    if orjson is not None:
+        payload = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(settings, indent=2).encode('utf-8')
+
+    payload_hash = hash(payload)
+    if st.session_state.get('_settings_hash') == payload_hash and CONFIG_FILE.exists():
+        return
+
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        # Write a uniquely named sibling temp file, then atomically rename
+        # it over the config: a crash mid-write never leaves truncated JSON
+        # behind, and concurrent saves never share a temp file
+        tmp = tempfile.NamedTemporaryFile(
+            dir=CONFIG_FILE.parent, prefix=CONFIG_FILE.name, suffix='.tmp', delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, CONFIG_FILE)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        st.session_state._settings_hash = payload_hash
     except Exception as e:
         st.error(f"Failed to save settings to file: {str(e)}")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _parse_settings_file(path: str, mtime_ns: int) -> dict:
+    """Parse the settings file; cached until its mtime changes."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def load_settings_from_file() -> dict:
     """Load settings from JSON file.
 
+    The parsed dict is cached on the file's mtime, so repeated loads of an
+    unchanged file skip the disk read and JSON parse.
+
     Returns:
         dict: Settings dictionary, or empty dict if file doesn't exist
     """
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            st.warning(f"Failed to load settings from file: {str(e)}")
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    try:
+        return _parse_settings_file(str(CONFIG_FILE), mtime_ns)
+    except Exception as e:
+        st.warning(f"Failed to load settings from file: {str(e)}")
     return {}
 
 
+def _token_fingerprint(api_token: Optional[str]) -> Optional[str]:
+    """Return a keyed hash of the API token, or None when there is none."""
+    if not api_token:
+        return None
+    return hmac.new(_TOKEN_FP_KEY, api_token.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def _get_client(base_url: str, api_token: Optional[str]) -> ZeroClawAPIClient:
+    """Return this session's API client so its connection pool is reused.
+
+    Held in session state rather than st.cache_resource: Streamlit runs each
+    browser session on its own thread and requests.Session is not
+    thread-safe, so sessions must not share a client. Only one client is
+    kept per session; changing the URL or token closes the old one.
+    """
+    key = (base_url, _token_fingerprint(api_token))
+    cached = st.session_state.get('_api_client')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    if cached:
+        cached[1].close()
+    client = ZeroClawAPIClient(base_url=base_url, api_token=api_token)
+    st.session_state._api_client = (key, client)
+    return client
+
+
+def _check_health(base_url: str, api_token: Optional[str]) -> dict:
+    """Probe gateway health, reusing a recent successful result.
+
+    A successful probe of the same gateway within HEALTH_FRESH_NS is
+    returned from session state without another network round-trip.
+    Failures are never cached.
+    """
+    key = (base_url, _token_fingerprint(api_token))
+    now_ns = time.monotonic_ns()
+    cached = st.session_state.get('_last_health')
+    last_ok_ns = st.session_state.get('_last_health_ok_ns', 0)
+    if cached and cached[0] == key and now_ns - last_ok_ns < HEALTH_FRESH_NS:
+        return cached[1]
+
+    health = _get_client(base_url, api_token).get_health()
+    if health.get('status') == 'ok':
+        st.session_state._last_health = (key, health)
+        st.session_state._last_health_ok_ns = now_ns
+    return health
+
+
 def validate_gateway_url(url: str) -> tuple[bool, str]:
     """Validate gateway URL format.
 
@@ -63,12 +191,11 @@ def validate_gateway_url(url: str) -> tuple[bool, str]:
     if not url:
         return False, "Gateway URL cannot be empty"
 
-    if not url.startswith(('http://', 'https://')):
+    if not url.startswith(_VALID_SCHEMES):
         return False, "Gateway URL must start with http:// or https://"
 
     # Basic URL validation
     try:
-        from urllib.parse import urlparse
         result = urlparse(url)
         if not all([result.scheme, result.netloc]):
             return False, "Invalid URL format"
@@ -83,6 +210,9 @@ def render() -> None:
     st.title("⚙️ Settings")
     st.caption("Configure your ZeroClaw instance")
 
+    # Widget changes only mark settings dirty; they are written once at the end
+    dirty = False
+
     # Load saved settings on first visit
     if 'settings_loaded' not in st.session_state:
         saved_settings = load_settings_from_file()
@@ -97,13 +227,20 @@ def render() -> None:
             )
         st.session_state.settings_loaded = True
 
+    # Bind session state and current preference values once for this run
+    ss = st.session_state
+    cur_theme = ss.get('theme', 'matrix-green')
+    cur_font = ss.get('font_size', 'medium')
+    cur_debug = ss.get('debug_mode', False)
+    cur_auto = ss.get('auto_refresh', True)
+
     # Gateway Configuration Section
     st.subheader("Gateway Configuration")
 
     with st.form("gateway_settings"):
         gateway_url = st.text_input(
             "Gateway URL",
-            value=st.session_state.get('gateway_url', 'http://localhost:3000'),
+            value=ss.get('gateway_url', 'http://localhost:3000'),
             placeholder="http://localhost:3000",
             help="URL of the ZeroClaw gateway service"
         )
@@ -111,7 +248,7 @@ def render() -> None:
         api_token = st.text_input(
             "API Token",
             type="password",
-            value=st.session_state.get('api_token', ''),
+            value=ss.get('api_token', ''),
             placeholder="Optional authentication token",
             help="Optional bearer token for authenticated requests"
         )
@@ -147,11 +284,7 @@ def render() -> None:
             else:
                 try:
                     # Test connection
-                    client = ZeroClawAPIClient(
-                        base_url=gateway_url,
-                        api_token=api_token if api_token else None
-                    )
-                    health = client.get_health()
+                    health = _check_health(gateway_url, api_token if api_token else None)
 
                     if health.get('status') == 'ok':
                         st.success(f"✅ Connected! Gateway is healthy")
@@ -178,23 +311,12 @@ def render() -> None:
 
     with col1:
         # Theme selector
-        theme_options = ["Matrix Green", "Dark", "Light"]
-        current_theme = st.session_state.get('theme', 'matrix-green')
-
-        # Map internal theme names to display names
-        theme_map = {
-            'matrix-green': 'Matrix Green',
-            'dark': 'Dark',
-            'light': 'Light'
-        }
-        reverse_theme_map = {v: k for k, v in theme_map.items()}
-
-        current_theme_display = theme_map.get(current_theme, 'Matrix Green')
-        current_index = theme_options.index(current_theme_display)
+        current_theme_display = _THEME_MAP.get(cur_theme, 'Matrix Green')
+        current_index = _THEME_OPTIONS.index(current_theme_display)
 
         selected_theme = st.selectbox(
             "Theme",
-            theme_options,
+            _THEME_OPTIONS,
             index=current_index,
             help="Only Matrix Green theme is currently available"
         )
@@ -204,38 +326,28 @@ def render() -> None:
             st.caption("🚧 This theme is coming soon")
         else:
             # Update session state
-            new_theme = reverse_theme_map[selected_theme]
-            if st.session_state.get('theme') != new_theme:
+            new_theme = _REVERSE_THEME_MAP[selected_theme]
+            if cur_theme != new_theme:
                 update_settings(theme=new_theme)
-                save_settings_to_file()
+                dirty = True
 
     with col2:
         # Font size selector
-        font_size_options = ["Small", "Medium", "Large"]
-        current_font_size = st.session_state.get('font_size', 'medium')
-
-        font_size_map = {
-            'small': 'Small',
-            'medium': 'Medium',
-            'large': 'Large'
-        }
-        reverse_font_size_map = {v: k for k, v in font_size_map.items()}
-
-        current_font_display = font_size_map.get(current_font_size, 'Medium')
-        current_index = font_size_options.index(current_font_display)
+        current_font_display = _FONT_SIZE_MAP.get(cur_font, 'Medium')
+        current_index = _FONT_SIZE_OPTIONS.index(current_font_display)
 
         selected_font_size = st.selectbox(
             "Font Size",
-            font_size_options,
+            _FONT_SIZE_OPTIONS,
             index=current_index,
             help="Adjust text size throughout the app"
         )
 
         # Update session state
-        new_font_size = reverse_font_size_map[selected_font_size]
-        if st.session_state.get('font_size') != new_font_size:
+        new_font_size = _REVERSE_FONT_SIZE_MAP[selected_font_size]
+        if cur_font != new_font_size:
             update_settings(font_size=new_font_size)
-            save_settings_to_file()
+            dirty = True
 
     st.divider()
 
@@ -244,22 +356,25 @@ def render() -> None:
 
     debug_mode = st.checkbox(
         "Enable Debug Mode",
-        value=st.session_state.get('debug_mode', False),
+        value=cur_debug,
         help="Show additional debugging information throughout the app"
     )
 
-    if st.session_state.get('debug_mode') != debug_mode:
+    if cur_debug != debug_mode:
         update_settings(debug_mode=debug_mode)
-        save_settings_to_file()
+        dirty = True
 
     auto_refresh = st.checkbox(
         "Auto-refresh Reports",
-        value=st.session_state.get('auto_refresh', True),
+        value=cur_auto,
         help="Automatically refresh report listings periodically"
     )
 
-    if st.session_state.get('auto_refresh') != auto_refresh:
+    if cur_auto != auto_refresh:
         update_settings(auto_refresh=auto_refresh)
+        dirty = True
+
+    if dirty:
         save_settings_to_file()
 
     # Debug Information Section (if debug mode enabled)
@@ -268,11 +383,11 @@ def render() -> None:
         st.subheader("Debug Information")
 
         debug_info = {
-            "gateway_url": st.session_state.get('gateway_url'),
-            "api_token_set": bool(st.session_state.get('api_token')),
-            "theme": st.session_state.get('theme'),
-            "font_size": st.session_state.get('font_size'),
-            "auto_refresh": st.session_state.get('auto_refresh'),
+            "gateway_url": ss.get('gateway_url'),
+            "api_token_set": bool(ss.get('api_token')),
+            "theme": ss.get('theme'),
+            "font_size": ss.get('font_size'),
+            "auto_refresh": ss.get('auto_refresh'),
             "config_file_exists": CONFIG_FILE.exists(),
             "config_file_path": str(CONFIG_FILE)
         }
@@ -283,8 +398,8 @@ def render() -> None:
         with st.expander("Full Session State"):
             # Filter out sensitive information
             filtered_state = {
-                k: "***HIDDEN***" if k == 'api_token' else v
-                for k, v in dict(st.session_state).items()
+                k: "***HIDDEN***" if _SENSITIVE_KEY_RE.search(str(k)) else ss[k]
+                for k in ss
             }
             st.json(filtered_state)
 
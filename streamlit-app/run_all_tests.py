@@ -4,13 +4,21 @@ Master Test Orchestrator
 Runs all 5 testing teams in parallel and generates master report
 """
 
-import subprocess
+import asyncio
+import os
 import sys
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
-import threading
-import queue
+
+BASE_DIR = Path(__file__).parent
+
+# Only the tail of each team's output is kept for the report
+OUTPUT_TAIL_BYTES = 4096
+
+# Team report summaries are looked up within this many leading bytes
+REPORT_HEAD_BYTES = 65536
 
 class TestOrchestrator:
     def __init__(self):
@@ -50,63 +58,76 @@ class TestOrchestrator:
         self.start_time = None
         self.end_time = None
 
-    def run_team(self, team, result_queue):
-        """Run a single team's tests"""
+    @staticmethod
+    def _team_result(team, exit_code, duration, stdout, stderr):
+        """Build the result record for one team run"""
+        return {
+            'team': team['name'],
+            'script': team['script'],
+            'report': team['report'],
+            'critical': team['critical'],
+            'exit_code': exit_code,
+            'duration': duration,
+            'stdout': stdout,
+            'stderr': stderr,
+            'success': exit_code == 0
+        }
+
+    @staticmethod
+    def _read_tail(f):
+        """Return the last OUTPUT_TAIL_BYTES of a spooled output file as text"""
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - OUTPUT_TAIL_BYTES))
+        return f.read().decode(errors='replace')
+
+    async def run_team(self, team):
+        """Run a single team's tests as an asyncio subprocess
+
+        stdout/stderr go straight to anonymous temp files rather than
+        being buffered in memory; only their tails are kept.
+        """
         print(f"\n{'='*60}")
         print(f"LAUNCHING: {team['name']}")
         print(f"{'='*60}\n")
 
         start = time.time()
         try:
-            result = subprocess.run(
-                [sys.executable, team['script']],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout per team
-            )
-
-            duration = time.time() - start
-
-            result_data = {
-                'team': team['name'],
-                'script': team['script'],
-                'report': team['report'],
-                'critical': team['critical'],
-                'exit_code': result.returncode,
-                'duration': duration,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'success': result.returncode == 0
-            }
+            with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, team['script'],
+                    stdout=out,
+                    stderr=err
+                )
+                try:
+                    await asyncio.wait_for(
+                        proc.wait(),
+                        timeout=300  # 5 minute timeout per team
+                    )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    return self._team_result(
+                        team, -1, time.time() - start, '', 'Test timed out after 5 minutes'
+                    )
+
+                return self._team_result(
+                    team,
+                    proc.returncode,
+                    time.time() - start,
+                    self._read_tail(out),
+                    self._read_tail(err)
+                )
 
-            result_queue.put(result_data)
-
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start
-            result_queue.put({
-                'team': team['name'],
-                'script': team['script'],
-                'report': team['report'],
-                'critical': team['critical'],
-                'exit_code': -1,
-                'duration': duration,
-                'stdout': '',
-                'stderr': 'Test timed out after 5 minutes',
-                'success': False
-            })
         except Exception as e:
-            duration = time.time() - start
-            result_queue.put({
-                'team': team['name'],
-                'script': team['script'],
-                'report': team['report'],
-                'critical': team['critical'],
-                'exit_code': -1,
-                'duration': duration,
-                'stdout': '',
-                'stderr': str(e),
-                'success': False
-            })
+            return self._team_result(team, -1, time.time() - start, '', str(e))
+
+    async def _run_all(self):
+        """Run every team concurrently, recording each result as it finishes"""
+        for finished in asyncio.as_completed([self.run_team(team) for team in self.teams]):
+            result = await finished
+            self.results[result['team']] = result
+            status = "✅ PASS" if result['success'] else "❌ FAIL"
+            print(f"FINISHED: {status} {result['team']} ({result['duration']:.2f}s)")
 
     def run_all_teams(self):
         """Run all teams in parallel"""
@@ -119,24 +140,8 @@ class TestOrchestrator:
 
         self.start_time = time.time()
 
-        # Create result queue and threads
-        result_queue = queue.Queue()
-        threads = []
-
-        # Launch all teams concurrently
-        for team in self.teams:
-            thread = threading.Thread(target=self.run_team, args=(team, result_queue))
-            thread.start()
-            threads.append(thread)
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-
-        # Collect results
-        while not result_queue.empty():
-            result = result_queue.get()
-            self.results[result['team']] = result
+        # One event loop multiplexes all team subprocesses; no worker threads
+        asyncio.run(self._run_all())
 
         self.end_time = time.time()
 
@@ -162,10 +167,13 @@ class TestOrchestrator:
         }
 
     def generate_master_report(self):
-        """Generate master test report"""
+        """Generate master test report
+
+        Sections are collected in a list and joined once at the end.
+        """
         analysis = self.analyze_results()
 
-        report = f"""# ZeroClaw Streamlit UI - Master Test Report
+        parts = [f"""# ZeroClaw Streamlit UI - Master Test Report
 
 **Test Execution Time**: {datetime.now().isoformat()}
 **Total Duration**: {analysis['duration']:.2f} seconds
@@ -184,65 +192,66 @@ class TestOrchestrator:
 - **Failed**: {analysis['failed_teams']}
 - **Success Rate**: {(analysis['passed_teams'] / analysis['total_teams'] * 100):.1f}%
 
-"""
+"""]
 
         if analysis['critical_failures']:
-            report += """
+            parts.append("""
 ## 🔴 CRITICAL FAILURES
 
 The following critical test suites failed and MUST be fixed before deployment:
 
-"""
+""")
             for failure in analysis['critical_failures']:
-                report += f"- **{failure['team']}**\n"
-                report += f"  - Exit Code: {failure['exit_code']}\n"
-                report += f"  - Duration: {failure['duration']:.2f}s\n"
+                parts.append(f"- **{failure['team']}**\n")
+                parts.append(f"  - Exit Code: {failure['exit_code']}\n")
+                parts.append(f"  - Duration: {failure['duration']:.2f}s\n")
                 if failure['stderr']:
-                    report += f"  - Error: {failure['stderr'][:200]}...\n"
-                report += "\n"
+                    parts.append(f"  - Error: {failure['stderr'][:200]}...\n")
+                parts.append("\n")
 
-        report += """
+        parts.append("""
 ## Team Summaries
 
-"""
+""")
 
         for team_name, result in sorted(self.results.items()):
             status = "✅ PASS" if result['success'] else "❌ FAIL"
             critical = " [CRITICAL]" if result['critical'] else ""
 
-            report += f"### {status} {team_name}{critical}\n\n"
-            report += f"- **Script**: `{result['script']}`\n"
-            report += f"- **Report**: `{result['report']}`\n"
-            report += f"- **Duration**: {result['duration']:.2f}s\n"
-            report += f"- **Exit Code**: {result['exit_code']}\n"
+            parts.append(f"### {status} {team_name}{critical}\n\n")
+            parts.append(f"- **Script**: `{result['script']}`\n")
+            parts.append(f"- **Report**: `{result['report']}`\n")
+            parts.append(f"- **Duration**: {result['duration']:.2f}s\n")
+            parts.append(f"- **Exit Code**: {result['exit_code']}\n")
 
-            # Try to read team report and extract summary
-            report_path = Path(__file__).parent / result['report']
+            # Try to read team report and extract summary. The summary sits
+            # near the top, so only a bounded head of the file is read.
+            report_path = BASE_DIR / result['report']
             if report_path.exists():
                 try:
-                    team_report = report_path.read_text()
-                    # Extract summary section
-                    if "## Summary" in team_report:
-                        summary_start = team_report.find("## Summary")
-                        summary_end = team_report.find("##", summary_start + 11)
-                        if summary_end > 0:
-                            summary = team_report[summary_start:summary_end].strip()
-                            report += f"\n{summary}\n"
-                except:
-                    pass
-
-            report += "\n"
-
-        report += """
+                    with open(report_path, 'rb') as f:
+                        head = f.read(REPORT_HEAD_BYTES)
+                except OSError:
+                    head = b''
+                summary_start = head.find(b"## Summary")
+                if summary_start >= 0:
+                    summary_end = head.find(b"##", summary_start + 11)
+                    if summary_end > 0:
+                        summary = head[summary_start:summary_end].decode('utf-8', 'replace').strip()
+                        parts.append(f"\n{summary}\n")
+
+            parts.append("\n")
+
+        parts.append("""
 ## Detailed Reports
 
 Each team has generated a detailed report:
 
-"""
+""")
         for team_name, result in sorted(self.results.items()):
-            report += f"- [{team_name}]({result['report']})\n"
+            parts.append(f"- [{team_name}]({result['report']})\n")
 
-        report += """
+        parts.append("""
 
 ## Test Coverage
 
@@ -292,10 +301,10 @@ Each team has generated a detailed report:
 
 ## Deployment Decision
 
-"""
+""")
 
         if analysis['overall_pass'] and analysis['critical_pass']:
-            report += """
+            parts.append("""
 ### ✅ GO FOR DEPLOYMENT
 
 All test suites passed successfully, including critical security and E2E tests.
@@ -307,9 +316,9 @@ The system is ready for production deployment.
 3. Monitor production metrics closely
 4. Keep test suites running in CI/CD
 
-"""
+""")
         elif analysis['critical_pass'] and not analysis['overall_pass']:
-            report += """
+            parts.append("""
 ### ⚠️ CONDITIONAL GO
 
 Critical tests passed, but some non-critical tests failed.
@@ -321,9 +330,9 @@ System can be deployed with caution.
 3. Deploy with monitoring
 4. Fix failures in next sprint
 
-"""
+""")
         else:
-            report += """
+            parts.append("""
 ### 🔴 NO-GO FOR DEPLOYMENT
 
 Critical test failures detected. DO NOT DEPLOY to production.
@@ -335,12 +344,12 @@ Critical test failures detected. DO NOT DEPLOY to production.
 4. Verify E2E workflows if Team 5 failed
 5. Only deploy after all tests pass
 
-"""
+""")
 
-        report += f"""
+        parts.append(f"""
 ## Bug Summary
 
-"""
+""")
         bugs = []
         for team_name, result in self.results.items():
             if not result['success']:
@@ -352,21 +361,21 @@ Critical test failures detected. DO NOT DEPLOY to production.
                 })
 
         if bugs:
-            report += f"**Total Bugs Found**: {len(bugs)}\n\n"
+            parts.append(f"**Total Bugs Found**: {len(bugs)}\n\n")
             for i, bug in enumerate(bugs, 1):
-                report += f"{i}. **{bug['severity']}**: {bug['description']}\n"
-                report += f"   - Error: {bug['error']}\n\n"
+                parts.append(f"{i}. **{bug['severity']}**: {bug['description']}\n")
+                parts.append(f"   - Error: {bug['error']}\n\n")
         else:
-            report += "**No bugs detected** - All tests passed!\n\n"
+            parts.append("**No bugs detected** - All tests passed!\n\n")
 
-        report += """
+        parts.append(f"""
 ---
 
 **Test Orchestrator Version**: 1.0
 **Generated**: {datetime.now().isoformat()}
-"""
+""")
 
-        return report
+        return "".join(parts)
 
     def print_summary(self):
         """Print summary to console"""
@@ -410,7 +419,7 @@ def main():
 
     # Generate master report
     report = orchestrator.generate_master_report()
-    report_path = Path(__file__).parent / "TEST_REPORT_MASTER.md"
+    report_path = BASE_DIR / "TEST_REPORT_MASTER.md"
     report_path.write_text(report)
 
     print(f"\n📄 Master report saved to: {report_path}")
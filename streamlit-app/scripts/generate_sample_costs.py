@@ -9,110 +9,174 @@ Usage:
 """
 
 import json
-import uuid
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from typing import Optional
 import os
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+# Model configurations with pricing (per million tokens)
+MODELS = [
+    {
+        "model": "anthropic/claude-sonnet-4",
+        "input_price": 3.0,
+        "output_price": 15.0,
+        "weight": 0.5  # Higher probability
+    },
+    {
+        "model": "openai/gpt-4o",
+        "input_price": 5.0,
+        "output_price": 15.0,
+        "weight": 0.3
+    },
+    {
+        "model": "anthropic/claude-3.5-sonnet",
+        "input_price": 3.0,
+        "output_price": 15.0,
+        "weight": 0.15
+    },
+    {
+        "model": "openai/gpt-4o-mini",
+        "input_price": 0.15,
+        "output_price": 0.6,
+        "weight": 0.05
+    }
+]
+
+# Day offsets (weighted toward recent) and normalized sampling probabilities,
+# computed once at import rather than per call
+_DAY_CHOICES = np.array([0, 1, 2, 7, 14, 30])
+_DAY_WEIGHTS = np.array([30, 20, 15, 15, 10, 10], dtype=np.float64)
+_DAY_PROBS = _DAY_WEIGHTS / _DAY_WEIGHTS.sum()
+_MODEL_WEIGHTS = np.array([m["weight"] for m in MODELS], dtype=np.float64)
+_MODEL_PROBS = _MODEL_WEIGHTS / _MODEL_WEIGHTS.sum()
+
+# Per-model columns (struct-of-arrays) gathered by model index
+_MODEL_NAMES = np.array([m["model"] for m in MODELS])
+_INPUT_PRICES = np.array([m["input_price"] for m in MODELS], dtype=np.float64)
+_OUTPUT_PRICES = np.array([m["output_price"] for m in MODELS], dtype=np.float64)
+
+
+def _batch_uuid4(count: int, rng: np.random.Generator) -> list:
+    """Return ``count`` random version-4 UUID strings from one rng.bytes call.
 
-def generate_sample_costs(output_file: str = "~/.zeroclaw/state/costs.jsonl", num_records: int = 50):
+    Args:
+        count: Number of UUIDs to generate
+        rng: Generator supplying the random bytes, so seeded runs repeat
+
+    Returns:
+        List of canonical 36-character UUID strings
+    """
+    raw = np.frombuffer(rng.bytes(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    hex_all = raw.tobytes().hex()
+    return [
+        f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        for h in (hex_all[i:i + 32] for i in range(0, 32 * count, 32))
+    ]
+
+
+def generate_sample_costs(
+    output_file: str = "~/.zeroclaw/state/costs.jsonl",
+    num_records: int = 50,
+    seed: Optional[int] = None
+):
     """Generate sample cost records.
 
+    All random sampling and cost arithmetic is done in batch with NumPy,
+    and timestamps are produced already sorted; a single Python pass then
+    assembles the record dicts.
+
     Args:
         output_file: Path to output costs.jsonl file
         num_records: Number of records to generate
+        seed: Optional RNG seed for reproducible output
     """
     output_file = os.path.expanduser(output_file)
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-    # Model configurations with pricing (per million tokens)
-    models = [
-        {
-            "model": "anthropic/claude-sonnet-4",
-            "input_price": 3.0,
-            "output_price": 15.0,
-            "weight": 0.5  # Higher probability
-        },
-        {
-            "model": "openai/gpt-4o",
-            "input_price": 5.0,
-            "output_price": 15.0,
-            "weight": 0.3
-        },
-        {
-            "model": "anthropic/claude-3.5-sonnet",
-            "input_price": 3.0,
-            "output_price": 15.0,
-            "weight": 0.15
-        },
-        {
-            "model": "openai/gpt-4o-mini",
-            "input_price": 0.15,
-            "output_price": 0.6,
-            "weight": 0.05
-        }
-    ]
-
-    # Generate session IDs (simulate 2-3 sessions)
-    session_ids = [str(uuid.uuid4()) for _ in range(3)]
+    rng = np.random.default_rng(seed)
+    n = num_records
+
+    # Random timestamp in last 30 days (weighted toward recent)
+    days_ago = rng.choice(_DAY_CHOICES, size=n, p=_DAY_PROBS)
+    hours_ago = rng.integers(0, 25, size=n)
+    minutes_ago = rng.integers(0, 61, size=n)
+
+    # Order records oldest-first by sorting the int64 offsets, not the records
+    offsets_s = days_ago * 86_400 + hours_ago * 3_600 + minutes_ago * 60
+    order = np.argsort(offsets_s, kind="stable")[::-1]
+    offsets_s = offsets_s[order]
+    days_ago = days_ago[order]
+    now = np.datetime64(datetime.utcnow(), "us")
+    timestamps = np.datetime_as_string(now - offsets_s.astype("timedelta64[s]"), unit="us")
+
+    # Select model based on weights
+    model_idx = rng.choice(len(MODELS), size=n, p=_MODEL_PROBS)
+
+    # Generate realistic token counts
+    input_tokens = rng.integers(500, 5001, size=n)
+    output_tokens = rng.integers(200, 2001, size=n)
+    total_tokens = input_tokens + output_tokens
+
+    # Calculate cost
+    cost_usd = np.round(
+        input_tokens / 1_000_000 * np.take(_INPUT_PRICES, model_idx) +
+        output_tokens / 1_000_000 * np.take(_OUTPUT_PRICES, model_idx),
+        6
+    )
+    model_names = np.take(_MODEL_NAMES, model_idx)
+
+    # Select session ID (recent records more likely to be in current session)
+    session_idx = np.where(
+        days_ago == 0,
+        0,  # Current session
+        np.where(days_ago <= 2, rng.integers(0, 2, size=n), rng.integers(0, 3, size=n))
+    )
+
+    # Generate session IDs (simulate 2-3 sessions) and record IDs; drawn
+    # last so the other columns keep their seeded values
+    session_ids = _batch_uuid4(3, rng)
+    record_ids = _batch_uuid4(n, rng)
 
     # Generate records spanning last 30 days
-    now = datetime.utcnow()
-    records = []
-
-    for i in range(num_records):
-        # Random timestamp in last 30 days (weighted toward recent)
-        days_ago = random.choices([0, 1, 2, 7, 14, 30], weights=[30, 20, 15, 15, 10, 10])[0]
-        hours_ago = random.randint(0, 24)
-        minutes_ago = random.randint(0, 60)
-
-        timestamp = now - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
-
-        # Select model based on weights
-        model = random.choices(
-            models,
-            weights=[m["weight"] for m in models]
-        )[0]
-
-        # Generate realistic token counts
-        input_tokens = random.randint(500, 5000)
-        output_tokens = random.randint(200, 2000)
-        total_tokens = input_tokens + output_tokens
-
-        # Calculate cost
-        cost_usd = (
-            (input_tokens / 1_000_000) * model["input_price"] +
-            (output_tokens / 1_000_000) * model["output_price"]
-        )
-
-        # Select session ID (recent records more likely to be in current session)
-        if days_ago == 0:
-            session_id = session_ids[0]  # Current session
-        elif days_ago <= 2:
-            session_id = random.choice(session_ids[:2])
-        else:
-            session_id = random.choice(session_ids)
-
-        record = {
-            "id": str(uuid.uuid4()),
-            "session_id": session_id,
-            "model": model["model"],
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": total_tokens,
-            "cost_usd": round(cost_usd, 6),
-            "timestamp": timestamp.isoformat() + "Z"
+    records = [
+        {
+            "id": record_id,
+            "session_id": session_ids[s_idx],
+            "model": model,
+            "input_tokens": in_tok,
+            "output_tokens": out_tok,
+            "total_tokens": tot_tok,
+            "cost_usd": cost,
+            "timestamp": ts + "Z"
         }
+        for record_id, s_idx, model, in_tok, out_tok, tot_tok, cost, ts in zip(
+            record_ids,
+            session_idx.tolist(),
+            model_names.tolist(),
+            input_tokens.tolist(),
+            output_tokens.tolist(),
+            total_tokens.tolist(),
+            cost_usd.tolist(),
+            timestamps.tolist()
+        )
+    ]
 
-        records.append(record)
-
-    # Sort by timestamp
-    records.sort(key=lambda r: r["timestamp"])
-
-    # Write to file
-    with open(output_file, 'w') as f:
-        for record in records:
-            f.write(json.dumps(record) + '\n')
+    # Write to file: serialize every line up front, then one buffered writelines
+    if orjson is not None:
+        lines = [orjson.dumps(record) + b'\n' for record in records]
+    else:
+        lines = [(json.dumps(record) + '\n').encode('utf-8') for record in records]
+    with open(output_file, 'wb') as f:
+        f.writelines(lines)
 
     print(f"Generated {len(records)} cost records")
     print(f"Output: {output_file}")
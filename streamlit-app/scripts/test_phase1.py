@@ -9,6 +9,7 @@ Usage:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path so we can import lib modules
@@ -17,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.costs_parser import costs_parser
 from lib.budget_manager import budget_manager, BudgetStatus
 from lib.agent_monitor import agent_monitor
+from _test_shared import ThreadLocalStdout
 
 
 def test_costs_parser():
@@ -33,8 +35,11 @@ def test_costs_parser():
 
     print("✅ costs.jsonl file exists")
 
+    # Summary, recent costs and token history from one pass over the file
+    snapshot = costs_parser.snapshot(hours=24, limit=10)
+
     # Get summary
-    summary = costs_parser.get_cost_summary()
+    summary = snapshot.summary
     print(f"\n📊 Cost Summary:")
     print(f"  Session cost:  ${summary['session_cost_usd']:.4f}")
     print(f"  Daily cost:    ${summary['daily_cost_usd']:.4f}")
@@ -51,11 +56,11 @@ def test_costs_parser():
         print("⚠️ No model breakdown available")
 
     # Get recent costs
-    recent = costs_parser.get_recent_costs(hours=24, limit=10)
+    recent = snapshot.recent
     print(f"\n🕐 Recent Costs (last 24h): {len(recent)} records")
 
     # Get token history
-    history = costs_parser.get_token_history(hours=24)
+    history = snapshot.history
     print(f"📊 Token History (last 24h): {len(history)} data points")
 
     print("\n✅ costs_parser tests PASSED\n")
@@ -178,16 +183,29 @@ def main():
     print("PHASE 1 INTEGRATION TESTS")
     print("=" * 60 + "\n")
 
-    results = []
-
-    # Test costs_parser
-    results.append(("costs_parser", test_costs_parser()))
-
-    # Test budget_manager
-    results.append(("budget_manager", test_budget_manager()))
-
-    # Test agent_monitor
-    results.append(("agent_monitor", test_agent_monitor()))
+    tests = [
+        ("costs_parser", test_costs_parser),
+        ("budget_manager", test_budget_manager),
+        ("agent_monitor", test_agent_monitor),
+    ]
+
+    # The tests read independent files, so run them concurrently and
+    # print each one's buffered output in the original order
+    stdout = ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {
+                name: executor.submit(stdout.run_buffered, test_func)
+                for name, test_func in tests
+            }
+            results = []
+            for name, future in futures.items():
+                result, output = future.result()
+                stdout.write(output)
+                results.append((name, result))
+    finally:
+        sys.stdout = stdout.default
 
     # Summary
     print("=" * 60)
@@ -3,10 +3,20 @@
 This script demonstrates basic usage and error handling of the API client.
 """
 
+import atexit
 import sys
+from functools import lru_cache
+from _test_shared import buffered_output
 from lib.api_client import api
 
 
+@lru_cache(maxsize=1)
+def _get_reports():
+    """Fetch the report list once; test_reports and test_report_content share it."""
+    return api.get_reports()
+
+
+@buffered_output
 def test_health():
     """Test health endpoint."""
     print("Testing health endpoint...")
@@ -25,11 +35,12 @@ def test_health():
         return False
 
 
+@buffered_output
 def test_reports():
     """Test reports endpoint."""
     print("\nTesting reports endpoint...")
     try:
-        reports = api.get_reports()
+        reports = _get_reports()
         print(f"  Found {len(reports)} reports:")
         for report in reports[:5]:  # Show first 5
             name = report.get('name', 'Unknown')
@@ -46,11 +57,12 @@ def test_reports():
         return False
 
 
+@buffered_output
 def test_report_content():
     """Test getting specific report content."""
     print("\nTesting report content endpoint...")
     try:
-        reports = api.get_reports()
+        reports = _get_reports()
         if not reports:
             print("  No reports available to test")
             return True
@@ -81,6 +93,9 @@ def main():
     print("ZeroClaw API Client Test Suite")
     print("=" * 60)
 
+    # All tests share the client's pooled connection; release it on exit
+    atexit.register(api.close)
+
     results = []
 
     # Test 1: Health
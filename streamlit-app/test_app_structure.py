@@ -11,18 +11,121 @@ This script validates:
 """
 
 import ast
+import re
 import sys
 from pathlib import Path
 
+import _test_shared
+from _test_shared import buffered_output, missing_files
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; a regex alternation is the fallback
+    ahocorasick = None
+
+
+def _app_ast():
+    """Return the shared app.py AST, or None (reported) if it doesn't parse."""
+    try:
+        return _test_shared.APP_AST
+    except SyntaxError as e:
+        print(f"✗ Cannot parse app.py: {e}")
+        return None
+
+
+# Nodes whose bodies are not executed when the module runs
+_DEFERRED_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+
+
+def _executed_st_calls(stmt):
+    """Yield the ``st.<attr>(...)`` calls a top-level statement runs at import.
+
+    Function and lambda bodies are skipped, since defining them calls
+    nothing. Calls are yielded in source order.
+    """
+    calls = []
+    stack = [stmt]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _DEFERRED_NODES):
+            # Decorators and defaults are still evaluated at definition
+            stack.extend(getattr(node, 'decorator_list', ()))
+            stack.extend(ast.iter_child_nodes(node.args))
+            continue
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == 'st'):
+            calls.append(node)
+        stack.extend(ast.iter_child_nodes(node))
+    calls.sort(key=lambda call: (call.lineno, call.col_offset))
+    return calls
+
+
+def _page_config_call(tree):
+    """Find the executed st.set_page_config() call and any st. call before it.
+
+    Returns:
+        Tuple of (set_page_config call or None, first other executed st.
+        call preceding it or None)
+    """
+    first_other = None
+    for stmt in tree.body:
+        for call in _executed_st_calls(stmt):
+            if call.func.attr == 'set_page_config':
+                return call, first_other
+            if first_other is None:
+                first_other = call
+    return None, first_other
+
+
+def _import_keys(tree):
+    """Collect every import in the AST as a (module, name, asname) tuple.
+
+    Plain ``import x as y`` statements have module None.
+    """
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add((None, alias.name, alias.asname))
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                imports.add((node.module, alias.name, alias.asname))
+    return imports
+
+
+def _find_needles(source, needles):
+    """Return which of ``needles`` occur in ``source`` in a single scan.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed (which
+    also reports overlapping matches), otherwise one regex alternation.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        return {needle for _, needle in automaton.iter(source)}
+
+    pattern = re.compile('|'.join(map(re.escape, needles)))
+    return set(pattern.findall(source))
+
+
+def _report_missing(needles, found, label):
+    """Print a line per needle and return True when none are missing."""
+    for needle in needles:
+        if needle in found:
+            print(f"✓ Found{label}: {needle}")
+        else:
+            print(f"✗ Missing{label}: {needle}")
+            return False
+    return True
+
+
+@buffered_output
 def test_app_syntax():
     """Test that app.py has valid Python syntax."""
-    app_path = Path(__file__).parent / "app.py"
-    
     try:
-        with open(app_path, 'r') as f:
-            source = f.read()
-        ast.parse(source)
+        _test_shared.load_app()
         print("✓ app.py has valid Python syntax")
         return True
     except SyntaxError as e:
@@ -30,54 +133,46 @@ def test_app_syntax():
         return False
 
 
+@buffered_output
 def test_imports():
     """Test that all required imports are present."""
-    app_path = Path(__file__).parent / "app.py"
-    
-    with open(app_path, 'r') as f:
-        source = f.read()
-    
-    required_imports = [
-        'import streamlit as st',
-        'from lib.session_state import initialize_session_state',
-        'from components.sidebar import render_sidebar',
-    ]
-    
-    for imp in required_imports:
-        if imp in source:
-            print(f"✓ Found: {imp}")
-        else:
-            print(f"✗ Missing: {imp}")
-            return False
-    
-    return True
+    tree = _app_ast()
+    if tree is None:
+        return False
+
+    required_imports = {
+        'import streamlit as st': (None, 'streamlit', 'st'),
+        'from lib.session_state import initialize_session_state':
+            ('lib.session_state', 'initialize_session_state', None),
+        'from components.sidebar import render_sidebar':
+            ('components.sidebar', 'render_sidebar', None),
+    }
+
+    missing = set(required_imports.values()) - _import_keys(tree)
+    found = {stmt for stmt, key in required_imports.items() if key not in missing}
 
+    return _report_missing(required_imports, found, "")
 
+
+@buffered_output
 def test_page_config():
     """Test that st.set_page_config() is present and correct."""
-    app_path = Path(__file__).parent / "app.py"
-    
-    with open(app_path, 'r') as f:
-        source = f.read()
-    
-    # Check that st.set_page_config appears before other st calls
-    lines = source.split('\n')
-    first_st_call = None
-    config_line = None
-    
-    for i, line in enumerate(lines):
-        if 'st.set_page_config' in line:
-            config_line = i
-        elif line.strip().startswith('st.') and 'import' not in line:
-            if first_st_call is None and 'st.set_page_config' not in line:
-                first_st_call = i
-    
-    if config_line is None:
+    tree = _app_ast()
+    if tree is None:
+        return False
+
+    config_call, first_st_call = _page_config_call(tree)
+    if config_call is None:
         print("✗ st.set_page_config() not found")
         return False
-    
-    print(f"✓ st.set_page_config() found at line {config_line}")
-    
+
+    print(f"✓ st.set_page_config() found at line {config_call.lineno}")
+
+    # Streamlit requires set_page_config to precede every other st. command
+    if first_st_call is not None:
+        print(f"✗ st. call at line {first_st_call.lineno} precedes st.set_page_config()")
+        return False
+
     # Check required parameters
     required_params = [
         'page_title=',
@@ -86,24 +181,16 @@ def test_page_config():
         'initial_sidebar_state=',
         'menu_items='
     ]
-    
-    for param in required_params:
-        if param in source:
-            print(f"✓ Found parameter: {param}")
-        else:
-            print(f"✗ Missing parameter: {param}")
-            return False
-    
-    return True
+    passed = {f"{kw.arg}=" for kw in config_call.keywords}
+
+    return _report_missing(required_params, passed, " parameter")
 
 
+@buffered_output
 def test_routing():
     """Test that routing logic is present."""
-    app_path = Path(__file__).parent / "app.py"
-    
-    with open(app_path, 'r') as f:
-        source = f.read()
-    
+    source = _test_shared.APP_SRC
+
     routes = [
         'if selected_page == "Dashboard"',
         'elif selected_page == "Analytics"',
@@ -111,41 +198,26 @@ def test_routing():
         'elif selected_page == "Analyze"',
         'elif selected_page == "Settings"',
     ]
-    
-    for route in routes:
-        if route in source:
-            print(f"✓ Found route: {route}")
-        else:
-            print(f"✗ Missing route: {route}")
-            return False
-    
-    return True
+
+    return _report_missing(routes, _find_needles(source, routes), " route")
 
 
+@buffered_output
 def test_theme_css():
     """Test that Matrix Green theme CSS is present."""
-    app_path = Path(__file__).parent / "app.py"
-    
-    with open(app_path, 'r') as f:
-        source = f.read()
-    
+    source = _test_shared.APP_SRC
+
     css_elements = [
         '--background-color: #000000',
         '--primary-color: #5FAF87',
         '--foreground-color: #87D7AF',
         'Matrix Green Theme',
     ]
-    
-    for element in css_elements:
-        if element in source:
-            print(f"✓ Found CSS: {element}")
-        else:
-            print(f"✗ Missing CSS: {element}")
-            return False
-    
-    return True
+
+    return _report_missing(css_elements, _find_needles(source, css_elements), " CSS")
 
 
+@buffered_output
 def test_file_structure():
     """Test that required files and directories exist."""
     base_path = Path(__file__).parent
@@ -161,9 +233,9 @@ def test_file_structure():
         'pages/__init__.py',
     ]
     
+    missing = missing_files(base_path, required_files)
     for file_path in required_files:
-        full_path = base_path / file_path
-        if full_path.exists():
+        if file_path not in missing:
             print(f"✓ Found: {file_path}")
         else:
             print(f"✗ Missing: {file_path}")
@@ -7,40 +7,71 @@ This script validates:
 4. Integration cohesion
 """
 
+import importlib
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 # Add streamlit-app to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from _test_shared import buffered_output, missing_files
 
+# RAM-backed scratch storage where /dev/shm exists
+_TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Modules exercised by this suite and the names each must expose
+_REQUIRED_MODULES = {
+    "components.chat.message_history": ("render_message_history",),
+    "components.chat.message_input": ("render_message_input", "create_message"),
+    "lib.conversation_manager": ("ConversationManager",),
+    "lib.realtime_poller": ("RealtimePoller",),
+    "pages.chat": (),
+}
+
+
+def _import_modules():
+    """Import every required module once, stopping at the first failure.
+
+    Returns:
+        Tuple of (modules by name, ImportError or None)
+    """
+    modules = {}
+    for name in _REQUIRED_MODULES:
+        try:
+            modules[name] = importlib.import_module(name)
+        except ImportError as e:
+            return modules, e
+    return modules, None
+
+
+_MODS, _IMPORT_ERROR = _import_modules()
+
+
+@buffered_output
 def test_imports():
     """Test that all components can be imported."""
     print("Testing imports...")
 
-    try:
-        # Component imports
-        from components.chat.message_history import render_message_history
-        from components.chat.message_input import render_message_input, create_message
-        print("✓ Chat components imported successfully")
-
-        # Library imports
-        from lib.conversation_manager import ConversationManager
-        from lib.realtime_poller import RealtimePoller
-        print("✓ Library modules imported successfully")
+    if _IMPORT_ERROR is not None:
+        print(f"✗ Import error: {_IMPORT_ERROR}")
+        return False
 
-        # Page import
-        from pages import chat
-        print("✓ Chat page imported successfully")
+    for name, attrs in _REQUIRED_MODULES.items():
+        missing = [attr for attr in attrs if not hasattr(_MODS[name], attr)]
+        if missing:
+            print(f"✗ Import error: cannot import {', '.join(missing)} from {name}")
+            return False
 
-        return True
+    print("✓ Chat components imported successfully")
+    print("✓ Library modules imported successfully")
+    print("✓ Chat page imported successfully")
 
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
-        return False
+    return True
 
 
+@buffered_output
 def test_file_structure():
     """Test that all required files exist."""
     print("\nTesting file structure...")
@@ -57,29 +88,29 @@ def test_file_structure():
         "PHASE1_5_CONTRACTS.md"
     ]
 
-    all_exist = True
+    missing = missing_files(base_dir, required_files)
+    all_exist = not missing
     for file_path in required_files:
-        full_path = base_dir / file_path
-        if full_path.exists():
+        if file_path not in missing:
             print(f"✓ {file_path}")
         else:
             print(f"✗ {file_path} (missing)")
-            all_exist = False
 
     return all_exist
 
 
+@buffered_output
 def test_conversation_manager():
     """Test ConversationManager basic functionality."""
     print("\nTesting ConversationManager...")
 
     try:
         from lib.conversation_manager import ConversationManager
-        import tempfile
 
-        # Create manager with temp directory
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = ConversationManager(tmpdir)
+        # Fresh scratch directory per run, so leftovers from an earlier or
+        # failed run can't change the conversation count below
+        with tempfile.TemporaryDirectory(dir=_TMP_ROOT) as tmp_dir:
+            manager = ConversationManager(tmp_dir)
 
             # Test save
             messages = [
@@ -122,7 +153,7 @@ def test_conversation_manager():
             stats = manager.get_stats()
             print(f"✓ Stats: {stats}")
 
-        return True
+            return True
 
     except Exception as e:
         print(f"✗ ConversationManager test failed: {e}")
@@ -131,6 +162,7 @@ def test_conversation_manager():
         return False
 
 
+@buffered_output
 def test_message_creation():
     """Test message creation utility."""
     print("\nTesting message creation...")
@@ -163,6 +195,7 @@ def test_message_creation():
         return False
 
 
+@buffered_output
 def test_realtime_poller():
     """Test RealtimePoller basic functionality."""
     print("\nTesting RealtimePoller...")
@@ -187,6 +220,45 @@ def test_realtime_poller():
             print("✗ Polling should be enabled")
             return False
 
+        # Test idle: enabled but no registered consumers never polls
+        import streamlit as st
+        st.session_state.chat_last_check = 0
+        if not poller.should_poll_now():
+            print("✓ Idle with no registered handles")
+        else:
+            print("✗ Should not poll with no registered handles")
+            return False
+
+        poller.register()
+        if poller.active_handles() == 1 and poller.should_poll_now():
+            print("✓ Polls once a handle is registered")
+        else:
+            print("✗ Should poll with a registered handle")
+            return False
+
+        poller.unregister()
+        if poller.active_handles() == 0 and not poller.should_poll_now():
+            print("✓ Idle again after last handle unregistered")
+        else:
+            print("✗ Should be idle after unregistering")
+            return False
+
+        # The "Enable polling" toggle holds its own handle
+        poller.set_toggle_handle(True)
+        poller.set_toggle_handle(True)
+        if poller.active_handles() == 1 and poller.should_poll_now():
+            print("✓ Polling toggle alone keeps polling")
+        else:
+            print("✗ Polling toggle should hold one handle")
+            return False
+
+        poller.set_toggle_handle(False)
+        if poller.active_handles() == 0:
+            print("✓ Polling toggle releases its handle")
+        else:
+            print("✗ Polling toggle should release its handle")
+            return False
+
         poller.stop_polling()
         if not poller.is_polling():
             print("✓ Polling stopped")
@@ -211,6 +283,7 @@ def test_realtime_poller():
         return False
 
 
+@buffered_output
 def test_integration():
     """Test that components can work together."""
     print("\nTesting integration...")
@@ -5,33 +5,111 @@ Validates all Streamlit UI components and pages
 """
 
 import sys
-import importlib
+import time
+import os
+import json
+import importlib.util
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from _test_shared import cached_import, probe_imports, write_file
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+BASE_DIR = Path(__file__).parent
+
+# Generated or third-party trees never checked for syntax
+_SKIP_DIRS = {
+    '__pycache__', '.venv', 'venv', '.git', 'node_modules',
+    '.mypy_cache', '.pytest_cache',
+}
+
+
 class Team1UITester:
+    JSON_REPORT = "test_results_ui.json"
+
+    _PASS_PREFIX = "✓ "
+    _FAIL_PREFIX = "✗ "
+
     def __init__(self):
+        self._W = sys.stdout.write
         self.results = []
         self.passed = 0
         self.failed = 0
+        # Wall-clock anchor; per-result times are monotonic offsets from it
+        self._t0 = datetime.now()
+        self._mono0 = time.monotonic_ns()
+        self._pool = None
+        self._import_failed = {}
+        # Modules whose source (or a parent package's) failed the syntax check
+        self._syntax_broken = set()
+
+    def _import_pool(self):
+        """Worker pool shared by the import tests, started on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=sys.path.insert,
+                initargs=(0, str(BASE_DIR)),
+            )
+        return self._pool
+
+    def _is_syntax_broken(self, module_name):
+        """True if the module or one of its parent packages has a syntax error"""
+        parts = module_name.split('.')
+        return any('.'.join(parts[:i]) in self._syntax_broken
+                   for i in range(1, len(parts) + 1))
+
+    def _check_imports(self, modules):
+        """Import modules across the worker pool and log each result"""
+        # Known syntax errors fail without paying for a loader round trip
+        broken = [name for name in modules if self._is_syntax_broken(name)]
+        results = {}
+        for name in broken:
+            results[name] = (name, "FAIL", "skipped: syntax error")
+        importable = [name for name in modules if name not in results]
+        for result in probe_imports(importable, self._import_pool().map):
+            results[result[0]] = result
+
+        for name in modules:
+            _, status, err = results[name]
+            if status != "PASS":
+                self._import_failed[name] = err
+            self.log(f"Import {name}", status, err)
+
+    def close(self):
+        """Shut down the import worker pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def log(self, test_name, status, details=""):
         result = {
             "test": test_name,
             "status": status,
             "details": details,
-            "timestamp": datetime.now().isoformat()
+            "offset_ns": time.monotonic_ns() - self._mono0
         }
         self.results.append(result)
         if status == "PASS":
             self.passed += 1
-            print(f"✓ {test_name}")
+            self._W(self._PASS_PREFIX)
+            self._W(test_name)
+            self._W("\n")
         else:
             self.failed += 1
-            print(f"✗ {test_name}")
+            self._W(self._FAIL_PREFIX)
+            self._W(test_name)
+            self._W("\n")
             if details:
-                print(f"  Details: {details}")
+                self._W("  Details: ")
+                self._W(str(details))
+                self._W("\n")
 
     def test_page_imports(self):
         """Test that all page modules can be imported"""
@@ -45,12 +123,7 @@ class Team1UITester:
             'pages.settings'
         ]
 
-        for page_module in pages:
-            try:
-                importlib.import_module(page_module)
-                self.log(f"Import {page_module}", "PASS")
-            except Exception as e:
-                self.log(f"Import {page_module}", "FAIL", str(e))
+        self._check_imports(pages)
 
     def test_component_imports(self):
         """Test that all component modules can be imported"""
@@ -82,12 +155,7 @@ class Team1UITester:
             'components.reports.reports_listing',
         ]
 
-        for comp_module in components:
-            try:
-                importlib.import_module(comp_module)
-                self.log(f"Import {comp_module}", "PASS")
-            except Exception as e:
-                self.log(f"Import {comp_module}", "FAIL", str(e))
+        self._check_imports(components)
 
     def test_lib_imports(self):
         """Test that all library modules can be imported"""
@@ -111,27 +179,37 @@ class Team1UITester:
             'lib.mock_data',
         ]
 
-        for lib_module in libs:
-            try:
-                importlib.import_module(lib_module)
-                self.log(f"Import {lib_module}", "PASS")
-            except Exception as e:
-                self.log(f"Import {lib_module}", "FAIL", str(e))
+        self._check_imports(libs)
+
+    @staticmethod
+    def _module_name(py_file):
+        """Dotted module name of a source file under BASE_DIR"""
+        rel = os.path.splitext(os.path.relpath(py_file, BASE_DIR))[0]
+        name = rel.replace(os.sep, '.')
+        if name.endswith('.__init__'):
+            name = name[:-len('.__init__')]
+        return name
 
     def test_syntax_validation(self):
         """Test Python syntax on all .py files"""
-        import py_compile
-
-        base_path = Path(__file__).parent
-        py_files = list(base_path.rglob("*.py"))
-
+        # Prune skipped trees during the walk instead of filtering afterwards
+        py_files = []
+        for dirpath, dirnames, filenames in os.walk(BASE_DIR):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            py_files.extend(
+                os.path.join(dirpath, f) for f in filenames if f.endswith('.py')
+            )
+
+        # Compile in memory only: we just need SyntaxError, not a .pyc
         syntax_errors = 0
         for py_file in py_files:
             try:
-                py_compile.compile(str(py_file), doraise=True)
-            except py_compile.PyCompileError as e:
+                with open(py_file, 'rb') as f:
+                    compile(f.read(), py_file, 'exec', dont_inherit=True)
+            except (SyntaxError, ValueError) as e:
                 syntax_errors += 1
-                self.log(f"Syntax check {py_file.name}", "FAIL", str(e))
+                self._syntax_broken.add(self._module_name(py_file))
+                self.log(f"Syntax check {os.path.basename(py_file)}", "FAIL", str(e))
 
         if syntax_errors == 0:
             self.log(f"Syntax validation ({len(py_files)} files)", "PASS")
@@ -148,16 +226,35 @@ class Team1UITester:
         ]
 
         for module_name, class_or_func in tests:
+            # Modules that already failed, or cannot be found at all, are
+            # reported without paying for another import attempt
+            if module_name in self._import_failed:
+                self.log(f"Load {module_name}.{class_or_func}", "FAIL",
+                        self._import_failed[module_name])
+                continue
             try:
-                module = importlib.import_module(module_name)
-                obj = getattr(module, class_or_func)
+                if importlib.util.find_spec(module_name) is None:
+                    self.log(f"Load {module_name}.{class_or_func}", "FAIL",
+                            f"No module spec found for {module_name}")
+                    continue
+                module = cached_import(module_name)
+                if not hasattr(module, class_or_func):
+                    raise AttributeError(
+                        f"module {module_name!r} has no attribute {class_or_func!r}")
                 self.log(f"Load {module_name}.{class_or_func}", "PASS")
             except Exception as e:
                 self.log(f"Load {module_name}.{class_or_func}", "FAIL", str(e))
 
+    def generate_json(self):
+        """Serialize raw results for the JSON sidecar report"""
+        payload = {"started": self._t0.isoformat(), "results": self.results}
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
+
     def generate_report(self):
         """Generate markdown report"""
-        report = f"""# Team 1: UI/Frontend Testing Results
+        parts = [f"""# Team 1: UI/Frontend Testing Results
 
 **Test Execution Time**: {datetime.now().isoformat()}
 
@@ -172,28 +269,29 @@ class Team1UITester:
 
 ## Detailed Results
 
-"""
-        for result in self.results:
-            status_icon = "✓" if result["status"] == "PASS" else "✗"
-            report += f"### {status_icon} {result['test']}\n"
-            report += f"- **Status**: {result['status']}\n"
-            if result['details']:
-                report += f"- **Details**: {result['details']}\n"
-            report += f"- **Time**: {result['timestamp']}\n\n"
-
-        report += f"""
+Per-test status, details and timing: [{self.JSON_REPORT}]({self.JSON_REPORT})
+
+"""]
+        failures = [r for r in self.results if r["status"] != "PASS"]
+        if failures:
+            parts.append("### Failures\n")
+            parts.extend(f"- ✗ {r['test']}: {r['details']}\n" for r in failures)
+            parts.append("\n")
+
+        parts.append("""
 ## Recommendations
 
-"""
+""")
         if self.failed == 0:
-            report += "- All UI/Frontend tests passed successfully\n"
-            report += "- UI components are ready for integration testing\n"
+            parts.append("- All UI/Frontend tests passed successfully\n")
+            parts.append("- UI components are ready for integration testing\n")
         else:
-            report += "- Fix import errors before proceeding\n"
-            report += "- Verify all dependencies are installed\n"
-            report += "- Check Python version compatibility\n"
+            parts.append("- Fix import errors before proceeding\n")
+            parts.append("- Verify all dependencies are installed\n")
+            parts.append("- Check Python version compatibility\n")
+
+        return "".join(parts)
 
-        return report
 
 def main():
     print("=" * 60)
@@ -203,6 +301,11 @@ def main():
 
     tester = Team1UITester()
 
+    # Cheap syntax gate first so imports of known-broken modules are skipped
+    print("Validating Python syntax...")
+    tester.test_syntax_validation()
+    print()
+
     print("Testing page imports...")
     tester.test_page_imports()
     print()
@@ -215,24 +318,24 @@ def main():
     tester.test_lib_imports()
     print()
 
-    print("Validating Python syntax...")
-    tester.test_syntax_validation()
-    print()
-
     print("Testing critical classes...")
     tester.test_critical_classes()
     print()
 
+    tester.close()
+
     # Generate report
     report = tester.generate_report()
 
-    report_path = Path(__file__).parent / "test_results_ui.md"
-    report_path.write_text(report)
+    report_path = BASE_DIR / "test_results_ui.md"
+    write_file(report_path, report.encode('utf-8'))
+    write_file(report_path.with_name(tester.JSON_REPORT), tester.generate_json())
 
     print("=" * 60)
     print(f"Report saved to: {report_path}")
     print(f"Results: {tester.passed} passed, {tester.failed} failed")
     print("=" * 60)
+    sys.stdout.flush()
 
     return 0 if tester.failed == 0 else 1
 
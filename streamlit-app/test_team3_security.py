@@ -5,9 +5,109 @@ Validates tool approval system and security boundaries (CRITICAL)
 """
 
 import sys
+import time
 import os
-from datetime import datetime
+import importlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple
+
+from _test_shared import ThreadLocalStdout, write_file
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Serializer handed to AuditLogger in the audit checks
+_json_dumps = orjson.dumps if orjson is not None else None
+
+_SEP = "=" * 60
+_PASS_GLYPH = "✓ "
+_FAIL_GLYPH = "✗ "
+_CRIT_GLYPH = "✗ [CRITICAL] "
+
+class SecurityResult(NamedTuple):
+    """One logged check"""
+    test: str
+    status: str
+    details: str
+    critical: bool
+    offset_ns: int
+
+# Security modules imported so far, and their import errors
+_MODS = {}
+_IMPORT_ERRORS = {}
+
+
+def _module(name):
+    """Import a security module on first use, re-raising a stored import error"""
+    module = _MODS.get(name)
+    if module is None:
+        if name in _IMPORT_ERRORS:
+            raise _IMPORT_ERRORS[name]
+        try:
+            module = _MODS[name] = importlib.import_module(name)
+        except Exception as e:
+            _IMPORT_ERRORS[name] = e
+            raise
+    return module
+
+# (test name, tool, parameters, accepted danger levels, critical on failure)
+CLASSIFICATION_CASES = [
+    ("Safe tool classification", "memory_recall", {"query": "test"}, ("SAFE",), False),
+    ("Dangerous tool classification", "shell", {"command": "ls"}, ("HIGH", "CRITICAL"), True),
+    ("Critical command detection", "shell", {"command": "rm -rf /"}, ("CRITICAL",), True),
+]
+
+# Report templates, filled with str.format_map in generate_report
+_HEADER_TMPL = """# Team 3: Security Testing Results
+
+**Test Execution Time**: {time}
+
+## ⚠️ CRITICAL STATUS
+{critical_status}
+
+## Summary
+- **Total Tests**: {total}
+- **Passed**: {passed}
+- **Failed**: {failed}
+- **Critical Failures**: {critical_count}
+- **Pass Rate**: {pass_rate:.1f}%
+
+## Overall Status
+{overall_status}
+
+"""
+
+_CRITICAL_TMPL = """
+## 🔴 Critical Failures
+The following critical security issues were detected:
+
+"""
+
+_REC_PASS_TMPL = """
+## Recommendations
+
+- ✅ All security tests passed successfully
+- ✅ Tool approval system is functional
+- ✅ Security boundaries are enforced
+- ✅ Audit logging is working correctly
+- ✅ Credentials are properly scrubbed
+"""
+
+_REC_FAIL_TMPL = """
+## Recommendations
+
+- ❌ Fix all critical security issues immediately
+- ❌ Do NOT deploy to production until security tests pass
+- ❌ Review security module implementations
+- ❌ Verify credential scrubbing is working
+- ❌ Test dangerous tool blocking thoroughly
+"""
 
 class Team3SecurityTester:
     def __init__(self):
@@ -15,28 +115,26 @@ class Team3SecurityTester:
         self.passed = 0
         self.failed = 0
         self.critical_failures = []
+        # Wall-clock anchor; per-result times are monotonic offsets from it
+        self._t0 = datetime.now()
+        self._mono0 = time.monotonic_ns()
 
     def log(self, test_name, status, details="", critical=False):
-        result = {
-            "test": test_name,
-            "status": status,
-            "details": details,
-            "critical": critical,
-            "timestamp": datetime.now().isoformat()
-        }
-        self.results.append(result)
-        if status == "PASS":
-            self.passed += 1
-            print(f"✓ {test_name}")
-        else:
+        self.results.append(SecurityResult(
+            test_name, status, details, critical, time.monotonic_ns() - self._mono0))
+        if status != "PASS":
             self.failed += 1
             if critical:
                 self.critical_failures.append(test_name)
-                print(f"✗ [CRITICAL] {test_name}")
+                print(_CRIT_GLYPH + test_name)
             else:
-                print(f"✗ {test_name}")
+                print(_FAIL_GLYPH + test_name)
             if details:
                 print(f"  Details: {details}")
+            return
+
+        self.passed += 1
+        print(_PASS_GLYPH + test_name)
 
     def test_security_module_imports(self):
         """Test that security modules can be imported"""
@@ -46,19 +144,20 @@ class Team3SecurityTester:
             ('lib.audit_logger', True),
         ]
 
+        # Every module here is exercised by a later block, so import it for
+        # real; the module or its error is cached for those blocks
         for module_name, critical in modules:
             try:
-                __import__(module_name)
-                self.log(f"Import {module_name}", "PASS", critical=critical)
+                _module(module_name)
             except Exception as e:
                 self.log(f"Import {module_name}", "FAIL", str(e), critical=critical)
+            else:
+                self.log(f"Import {module_name}", "PASS", critical=critical)
 
     def test_tool_interceptor(self):
         """Test tool interceptor functionality"""
         try:
-            from lib.tool_interceptor import ToolInterceptor, ToolDangerLevel
-
-            interceptor = ToolInterceptor()
+            interceptor = _module('lib.tool_interceptor').ToolInterceptor()
 
             # Test initialization
             if hasattr(interceptor, 'pending_calls'):
@@ -68,51 +167,31 @@ class Team3SecurityTester:
                         "Missing pending_calls attribute", critical=True)
                 return
 
-            # Test safe tool interception
-            try:
-                tool_call = interceptor.intercept('memory_recall', {'query': 'test'})
-                if tool_call.danger_level == ToolDangerLevel.SAFE:
-                    self.log("Safe tool classification", "PASS")
-                else:
-                    self.log("Safe tool classification", "FAIL",
-                            f"Expected SAFE, got {tool_call.danger_level}")
-            except Exception as e:
-                self.log("Safe tool classification", "FAIL", str(e))
-
-            # Test dangerous tool interception
-            try:
-                tool_call = interceptor.intercept('shell', {'command': 'ls'})
-                if tool_call.danger_level in [ToolDangerLevel.HIGH, ToolDangerLevel.CRITICAL]:
-                    self.log("Dangerous tool classification", "PASS",
-                            f"Classified as {tool_call.danger_level}")
-                else:
-                    self.log("Dangerous tool classification", "FAIL",
-                            f"Shell should be HIGH/CRITICAL, got {tool_call.danger_level}",
-                            critical=True)
-            except Exception as e:
-                self.log("Dangerous tool classification", "FAIL", str(e), critical=True)
-
-            # Test critical command detection
-            try:
-                tool_call = interceptor.intercept('shell', {'command': 'rm -rf /'})
-                if tool_call.danger_level == ToolDangerLevel.CRITICAL:
-                    self.log("Critical command detection", "PASS")
-                else:
-                    self.log("Critical command detection", "FAIL",
-                            f"rm -rf should be CRITICAL, got {tool_call.danger_level}",
-                            critical=True)
-            except Exception as e:
-                self.log("Critical command detection", "FAIL", str(e), critical=True)
+            for case in CLASSIFICATION_CASES:
+                self.check_classification(interceptor, case)
 
         except Exception as e:
             self.log("Tool interceptor tests", "FAIL", str(e), critical=True)
 
+    def check_classification(self, interceptor, case):
+        """Intercept one tool call and check its danger level"""
+        test_name, tool, params, expected, critical = case
+        try:
+            ToolDangerLevel = _module('lib.tool_interceptor').ToolDangerLevel
+            tool_call = interceptor.intercept(tool, params)
+            if tool_call.danger_level in [getattr(ToolDangerLevel, level) for level in expected]:
+                self.log(test_name, "PASS", f"Classified as {tool_call.danger_level}")
+            else:
+                self.log(test_name, "FAIL",
+                        f"Expected {'/'.join(expected)}, got {tool_call.danger_level}",
+                        critical=critical)
+        except Exception as e:
+            self.log(test_name, "FAIL", str(e), critical=critical)
+
     def test_approval_rejection_flow(self):
         """Test tool approval and rejection workflow"""
         try:
-            from lib.tool_interceptor import ToolInterceptor
-
-            interceptor = ToolInterceptor()
+            interceptor = _module('lib.tool_interceptor').ToolInterceptor()
 
             # Test approval flow
             tool_call = interceptor.intercept('shell', {'command': 'ls'})
@@ -144,9 +223,7 @@ class Team3SecurityTester:
     def test_security_analyzer(self):
         """Test security analysis functionality"""
         try:
-            from lib.security_analyzer import SecurityAnalyzer
-
-            analyzer = SecurityAnalyzer()
+            analyzer = _module('lib.security_analyzer').SecurityAnalyzer()
 
             # Test dangerous command analysis
             assessment = analyzer.analyze('shell', {'command': 'rm -rf /'})
@@ -180,34 +257,26 @@ class Team3SecurityTester:
     def test_audit_logger(self):
         """Test audit logging functionality"""
         try:
-            from lib.audit_logger import AuditLogger
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
-                temp_log = f.name
-
-            try:
-                logger = AuditLogger(log_file=temp_log)
-
-                # Test logging approval
-                logger.log_approval(
-                    tool_name='shell',
-                    parameters={'command': 'ls'},
-                    approver='test_user',
-                    approved=True
-                )
-
-                # Verify log file was written
-                log_path = Path(temp_log)
-                if log_path.exists() and log_path.stat().st_size > 0:
-                    self.log("Audit logging functionality", "PASS")
-                else:
-                    self.log("Audit logging functionality", "FAIL",
-                            "Log file not created or empty", critical=True)
-            finally:
-                # Cleanup
-                if Path(temp_log).exists():
-                    Path(temp_log).unlink()
+            AuditLogger = _module('lib.audit_logger').AuditLogger
+
+            # Entries go to an in-memory sink; file I/O is not under test here
+            stream = io.BytesIO()
+            logger = AuditLogger(stream=stream, json_dumps=_json_dumps)
+
+            # Test logging approval
+            logger.log_approval(
+                tool_name='shell',
+                parameters={'command': 'ls'},
+                approver='test_user',
+                approved=True
+            )
+
+            # Verify an entry was written
+            if stream.getvalue():
+                self.log("Audit logging functionality", "PASS")
+            else:
+                self.log("Audit logging functionality", "FAIL",
+                        "No audit entry written", critical=True)
 
         except Exception as e:
             self.log("Audit logger tests", "FAIL", str(e), critical=True)
@@ -215,37 +284,26 @@ class Team3SecurityTester:
     def test_credential_scrubbing(self):
         """Test that credentials are scrubbed from logs"""
         try:
-            from lib.audit_logger import AuditLogger
-            import tempfile
-            import json
-
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
-                temp_log = f.name
-
-            try:
-                logger = AuditLogger(log_file=temp_log)
-
-                # Log something with a credential-like parameter
-                logger.log_approval(
-                    tool_name='api_call',
-                    parameters={'api_key': 'sk-super-secret-key-12345', 'query': 'test'},
-                    approver='test_user',
-                    approved=True
-                )
-
-                # Read log and check for scrubbing
-                with open(temp_log, 'r') as f:
-                    log_content = f.read()
-
-                # Credential should NOT be in plain text
-                if 'sk-super-secret-key-12345' not in log_content:
-                    self.log("Credential scrubbing", "PASS", "API key properly redacted")
-                else:
-                    self.log("Credential scrubbing", "FAIL",
-                            "Credential found in log file (security leak!)", critical=True)
-            finally:
-                if Path(temp_log).exists():
-                    Path(temp_log).unlink()
+            AuditLogger = _module('lib.audit_logger').AuditLogger
+
+            stream = io.BytesIO()
+            logger = AuditLogger(stream=stream, json_dumps=_json_dumps)
+
+            # Log something with a credential-like parameter
+            logger.log_approval(
+                tool_name='api_call',
+                parameters={'api_key': 'sk-super-secret-key-12345', 'query': 'test'},
+                approver='test_user',
+                approved=True
+            )
+
+            # Credential should NOT be in plain text; search the raw bytes
+            # rather than decoding the log first
+            if stream.getvalue().find(b'sk-super-secret-key-12345') == -1:
+                self.log("Credential scrubbing", "PASS", "API key properly redacted")
+            else:
+                self.log("Credential scrubbing", "FAIL",
+                        "Credential found in log file (security leak!)", critical=True)
 
         except Exception as e:
             self.log("Credential scrubbing test", "FAIL", str(e), critical=True)
@@ -253,14 +311,14 @@ class Team3SecurityTester:
     def test_danger_levels_consistent(self):
         """Test that danger levels are consistent across modules"""
         try:
-            from lib.tool_interceptor import ToolDangerLevel as InterceptorDanger
-            from lib.tool_history_parser import ToolDangerLevel as ParserDanger
+            InterceptorDanger = _module('lib.tool_interceptor').ToolDangerLevel
+            ParserDanger = _module('lib.tool_history_parser').ToolDangerLevel
 
             # Check all levels exist in both
-            levels = ['SAFE', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+            levels = {'SAFE', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'}
 
-            missing_interceptor = [l for l in levels if not hasattr(InterceptorDanger, l)]
-            missing_parser = [l for l in levels if not hasattr(ParserDanger, l)]
+            missing_interceptor = sorted(levels - set(dir(InterceptorDanger)))
+            missing_parser = sorted(levels - set(dir(ParserDanger)))
 
             if not missing_interceptor and not missing_parser:
                 self.log("Danger level consistency", "PASS")
@@ -275,121 +333,179 @@ class Team3SecurityTester:
         except Exception as e:
             self.log("Danger level consistency test", "FAIL", str(e))
 
+    def merge(self, other):
+        """Append another tester's results, rebasing their time offsets"""
+        shift = other._mono0 - self._mono0
+        self.results.extend(r._replace(offset_ns=r.offset_ns + shift) for r in other.results)
+        self.passed += other.passed
+        self.failed += other.failed
+        self.critical_failures.extend(other.critical_failures)
+
     def generate_report(self):
         """Generate markdown report"""
-        report = f"""# Team 3: Security Testing Results
+        total = self.passed + self.failed
+        ctx = {
+            "time": datetime.now().isoformat(),
+            "critical_status": ('🔴 CRITICAL FAILURES DETECTED' if self.critical_failures
+                                else '✅ NO CRITICAL FAILURES'),
+            "total": total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "critical_count": len(self.critical_failures),
+            "pass_rate": (self.passed / total * 100) if total > 0 else 0,
+            "overall_status": ('❌ SECURITY VALIDATION FAILED' if self.failed > 0
+                               else '✅ ALL SECURITY TESTS PASSED'),
+        }
+        parts = [_HEADER_TMPL.format_map(ctx)]
+        if self.critical_failures:
+            parts.append(_CRITICAL_TMPL)
+            parts.extend(f"- **{failure}**\n" for failure in self.critical_failures)
+            parts.append("\n⚠️ **THESE MUST BE FIXED BEFORE PRODUCTION DEPLOYMENT**\n\n")
 
-**Test Execution Time**: {datetime.now().isoformat()}
+        parts.append("""
+## Detailed Results
 
-## ⚠️ CRITICAL STATUS
-{'🔴 CRITICAL FAILURES DETECTED' if self.critical_failures else '✅ NO CRITICAL FAILURES'}
+""")
+        # Unpack each row once rather than re-reading fields per line
+        for test, status, details, critical, offset_ns in self.results:
+            status_icon = "✓" if status == "PASS" else "✗"
+            critical_marker = " [CRITICAL]" if critical else ""
+            parts.append(f"### {status_icon} {test}{critical_marker}\n")
+            parts.append(f"- **Status**: {status}\n")
+            if details:
+                parts.append(f"- **Details**: {details}\n")
+            if critical:
+                parts.append("- **Severity**: CRITICAL\n")
+            timestamp = self._t0 + timedelta(microseconds=offset_ns // 1000)
+            parts.append(f"- **Time**: {timestamp.isoformat()}\n\n")
 
-## Summary
-- **Total Tests**: {self.passed + self.failed}
-- **Passed**: {self.passed}
-- **Failed**: {self.failed}
-- **Critical Failures**: {len(self.critical_failures)}
-- **Pass Rate**: {(self.passed / (self.passed + self.failed) * 100) if (self.passed + self.failed) > 0 else 0:.1f}%
+        parts.append(_REC_PASS_TMPL if self.failed == 0 else _REC_FAIL_TMPL)
 
-## Overall Status
-{'❌ SECURITY VALIDATION FAILED' if self.failed > 0 else '✅ ALL SECURITY TESTS PASSED'}
+        return "".join(parts)
 
-"""
-        if self.critical_failures:
-            report += f"""
-## 🔴 Critical Failures
-The following critical security issues were detected:
+def _run_section(method_name):
+    """Run one test block on a fresh tester and return the tester"""
+    tester = Team3SecurityTester()
+    getattr(tester, method_name)()
+    return tester
 
-"""
-            for failure in self.critical_failures:
-                report += f"- **{failure}**\n"
 
-            report += "\n⚠️ **THESE MUST BE FIXED BEFORE PRODUCTION DEPLOYMENT**\n\n"
+# pytest entry points: one item per independent block, so `pytest -n auto`
+# (pytest-xdist) can spread them across workers. main() below still runs
+# every block in one process and writes the markdown report.
+def _assert_no_failures(tester):
+    failures = [r for r in tester.results if r.status != "PASS"]
+    assert not failures, failures
 
-        report += """
-## Detailed Results
 
-"""
-        for result in self.results:
-            status_icon = "✓" if result["status"] == "PASS" else "✗"
-            critical_marker = " [CRITICAL]" if result.get("critical") else ""
-            report += f"### {status_icon} {result['test']}{critical_marker}\n"
-            report += f"- **Status**: {result['status']}\n"
-            if result['details']:
-                report += f"- **Details**: {result['details']}\n"
-            if result.get("critical"):
-                report += f"- **Severity**: CRITICAL\n"
-            report += f"- **Time**: {result['timestamp']}\n\n"
-
-        report += f"""
-## Recommendations
+def _run_block(method_name):
+    _assert_no_failures(_run_section(method_name))
 
-"""
-        if self.failed == 0:
-            report += "- ✅ All security tests passed successfully\n"
-            report += "- ✅ Tool approval system is functional\n"
-            report += "- ✅ Security boundaries are enforced\n"
-            report += "- ✅ Audit logging is working correctly\n"
-            report += "- ✅ Credentials are properly scrubbed\n"
-        else:
-            report += "- ❌ Fix all critical security issues immediately\n"
-            report += "- ❌ Do NOT deploy to production until security tests pass\n"
-            report += "- ❌ Review security module implementations\n"
-            report += "- ❌ Verify credential scrubbing is working\n"
-            report += "- ❌ Test dangerous tool blocking thoroughly\n"
-
-        return report
 
-def main():
-    print("=" * 60)
-    print("TEAM 3: SECURITY TESTING (CRITICAL)")
-    print("=" * 60)
-    print()
+def pytest_generate_tests(metafunc):
+    # Parametrize without importing pytest, so the script runs standalone
+    if "classification_case" in metafunc.fixturenames:
+        metafunc.parametrize("classification_case", CLASSIFICATION_CASES,
+                             ids=[case[0] for case in CLASSIFICATION_CASES])
 
+
+def test_security_module_imports():
+    _run_block("test_security_module_imports")
+
+
+def test_tool_classification(classification_case):
     tester = Team3SecurityTester()
+    tester.check_classification(_module('lib.tool_interceptor').ToolInterceptor(),
+                                classification_case)
+    _assert_no_failures(tester)
+
+
+def test_approval_rejection_flow():
+    _run_block("test_approval_rejection_flow")
 
-    print("Testing security module imports...")
-    tester.test_security_module_imports()
-    print()
 
-    print("Testing tool interceptor...")
-    tester.test_tool_interceptor()
-    print()
+def test_security_analyzer():
+    _run_block("test_security_analyzer")
 
-    print("Testing approval/rejection flow...")
-    tester.test_approval_rejection_flow()
-    print()
 
-    print("Testing security analyzer...")
-    tester.test_security_analyzer()
-    print()
+def test_audit_logger():
+    _run_block("test_audit_logger")
 
-    print("Testing audit logger...")
-    tester.test_audit_logger()
-    print()
 
-    print("Testing credential scrubbing...")
-    tester.test_credential_scrubbing()
-    print()
+def test_credential_scrubbing():
+    _run_block("test_credential_scrubbing")
+
+
+def test_danger_levels_consistent():
+    _run_block("test_danger_levels_consistent")
+
+
+_SEP_LINE = _SEP.encode() + b"\n"
+_BANNER = _SEP_LINE + b"TEAM 3: SECURITY TESTING (CRITICAL)\n" + _SEP_LINE + b"\n"
+
+
+def _write_stdout(blob):
+    """Write a pre-encoded block straight to fd 1, after any buffered text"""
+    sys.stdout.flush()
+    view = memoryview(blob)
+    while view:
+        view = view[os.write(sys.stdout.fileno(), view):]
+
+
+def main():
+    _write_stdout(_BANNER)
+
+    tester = Team3SecurityTester()
 
-    print("Testing danger level consistency...")
-    tester.test_danger_levels_consistent()
-    print()
+    # Block-buffer stdout even on a terminal and flush once per section
+    # instead of once per logged line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    sections = [
+        ("Testing security module imports...", "test_security_module_imports"),
+        ("Testing tool interceptor...", "test_tool_interceptor"),
+        ("Testing approval/rejection flow...", "test_approval_rejection_flow"),
+        ("Testing security analyzer...", "test_security_analyzer"),
+        ("Testing audit logger...", "test_audit_logger"),
+        ("Testing credential scrubbing...", "test_credential_scrubbing"),
+        ("Testing danger level consistency...", "test_danger_levels_consistent"),
+    ]
+
+    # The sections are independent, so each runs on its own tester in a
+    # worker thread; output and results are merged back in section order
+    stdout = ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) - 2)) as executor:
+            futures = [
+                (heading, executor.submit(stdout.run_buffered, partial(_run_section, name)))
+                for heading, name in sections
+            ]
+            for heading, future in futures:
+                section, output = future.result()
+                print(heading)
+                stdout.write(output)
+                print()
+                stdout.flush()
+                tester.merge(section)
+    finally:
+        sys.stdout = stdout.default
 
     # Generate report
     report = tester.generate_report()
 
     report_path = Path(__file__).parent / "test_results_security.md"
-    report_path.write_text(report)
+    write_file(report_path, report.encode("utf-8"))
 
-    print("=" * 60)
-    print(f"Report saved to: {report_path}")
-    print(f"Results: {tester.passed} passed, {tester.failed} failed")
+    summary = [
+        f"Report saved to: {report_path}\n",
+        f"Results: {tester.passed} passed, {tester.failed} failed\n",
+    ]
     if tester.critical_failures:
-        print(f"🔴 CRITICAL FAILURES: {len(tester.critical_failures)}")
-        for failure in tester.critical_failures:
-            print(f"  - {failure}")
-    print("=" * 60)
+        summary.append(f"🔴 CRITICAL FAILURES: {len(tester.critical_failures)}\n")
+        summary.extend(f"  - {failure}\n" for failure in tester.critical_failures)
+    _write_stdout(_SEP_LINE + "".join(summary).encode("utf-8") + _SEP_LINE)
 
     return 0 if tester.failed == 0 else 1
 
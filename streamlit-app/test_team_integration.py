@@ -2,16 +2,21 @@
 
 Tests cross-team integration and validates contracts.
 Run with: pytest test_team_integration.py
+
+The tests share no files (anything written goes under pytest's per-test
+tmp_path), so they can be spread across workers with pytest-xdist:
+pytest -n auto test_team_integration.py
 """
 
 import pytest
 import os
+from itertools import combinations
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
 # Team 1 imports
 from lib.cli_executor import ZeroClawCLIExecutor
-from lib.response_streamer import ResponseStreamer, ToolCallExtractor
+from lib.response_streamer import OutputType, ResponseStreamer, ToolCallExtractor
 
 # Team 2 imports
 from lib.process_monitor import ProcessMonitor
@@ -26,6 +31,24 @@ from lib.audit_logger import AuditLogger
 # Team 4 imports
 from lib.gateway_client import EnhancedGatewayClient
 
+# Contract file paths, as configured and as the readers should expand them
+MEMORY_PATH = "~/.zeroclaw/memory_store.json"
+COSTS_PATH = "~/.zeroclaw/state/costs.jsonl"
+MEMORY_FILE = os.path.expanduser(MEMORY_PATH)
+COSTS_FILE = os.path.expanduser(COSTS_PATH)
+
+
+@pytest.fixture(scope="session")
+def security_analyzer():
+    """SecurityAnalyzer keeps no per-call state, so it is shared."""
+    return SecurityAnalyzer()
+
+
+@pytest.fixture
+def interceptor():
+    """Fresh ToolInterceptor per test; it records pending/approved calls."""
+    return ToolInterceptor()
+
 
 class TestTeam1CLIExecution:
     """Test Team 1: Real Agent Chat components."""
@@ -50,7 +73,7 @@ class TestTeam1CLIExecution:
         tool_output = "<tool_call><name>shell</name><parameters>ls</parameters></tool_call>"
         outputs = streamer.parse_line(tool_output)
         # Should parse tool call
-        assert any(output.type.name == 'TOOL_CALL' for output in outputs)
+        assert any(output.type is OutputType.TOOL_CALL for output in outputs)
 
     def test_tool_extractor(self):
         """Test tool call extraction from output."""
@@ -76,50 +99,101 @@ class TestTeam2LiveDashboard:
         monitor = ProcessMonitor()
         assert monitor.known_processes == {}
 
-    def test_process_monitor_list(self):
+    def test_process_monitor_list(self, process_list):
         """Test process listing."""
-        monitor = ProcessMonitor()
-        processes = monitor.list_all_processes()
-        assert isinstance(processes, list)
+        assert isinstance(process_list, list)
 
-    def test_memory_reader_initialization(self):
+    def test_memory_reader_initialization(self, tmp_path):
         """Test memory reader can be initialized."""
-        reader = MemoryReader(memory_file="/tmp/test_memory.json")
-        assert reader.memory_file == "/tmp/test_memory.json"
+        memory_file = str(tmp_path / "test_memory.json")
+        reader = MemoryReader(memory_file=memory_file)
+        assert reader.memory_file == memory_file
 
-    def test_memory_reader_stats(self):
+    def test_memory_reader_stats(self, tmp_path):
         """Test memory stats retrieval."""
-        reader = MemoryReader(memory_file="/tmp/nonexistent.json")
+        reader = MemoryReader(memory_file=str(tmp_path / "nonexistent.json"))
         stats = reader.get_stats()
         assert 'entry_count' in stats
         assert 'file_exists' in stats
 
-    def test_costs_reader_initialization(self):
+    def test_costs_reader_initialization(self, tmp_path):
         """Test costs reader can be initialized."""
-        reader = CostsReader(costs_file="/tmp/test_costs.jsonl")
-        assert reader.costs_file == "/tmp/test_costs.jsonl"
-
-    def test_tool_history_parser(self):
+        costs_file = str(tmp_path / "test_costs.jsonl")
+        reader = CostsReader(costs_file=costs_file)
+        assert reader.costs_file == costs_file
+
+    def test_costs_parser_records_not_shared(self, tmp_path):
+        """Test cached cost records can't be mutated through the public API."""
+        from lib.costs_parser import parse_costs
+
+        costs_file = tmp_path / "test_costs.jsonl"
+        costs_file.write_text('{"id": "1", "cost_usd": 0.5, "timestamp": "2026-01-01T00:00:00Z"}\n')
+
+        first = parse_costs(str(costs_file))
+        first[0]['cost_usd'] = 99.0
+        assert parse_costs(str(costs_file))[0]['cost_usd'] == 0.5
+
+    def test_costs_parser_recent_without_limit(self, tmp_path):
+        """Test a limit of 0 returns every recent record, newest first."""
+        import json
+        from lib.costs_parser import CostsParser
+
+        now = datetime.utcnow()
+        costs_file = tmp_path / "test_costs.jsonl"
+        costs_file.write_text("".join(
+            json.dumps({"id": str(i), "cost_usd": 0.1,
+                        "timestamp": now.replace(microsecond=i).isoformat()}) + "\n"
+            for i in range(3)
+        ))
+
+        parser = CostsParser(str(costs_file))
+        assert [r['id'] for r in parser.get_recent_costs(limit=0)] == ['2', '1', '0']
+        assert [r['id'] for r in parser.get_recent_costs(limit=2)] == ['2', '1']
+        assert len(parser.snapshot(limit=0).recent) == 3
+
+    def test_tool_history_parser(self, tmp_path):
         """Test tool history parsing."""
-        parser = ToolHistoryParser(history_file="/tmp/test_history.jsonl")
+        parser = ToolHistoryParser(history_file=str(tmp_path / "test_history.jsonl"))
         history = parser.read_history()
         assert isinstance(history, list)
 
+    def test_delegation_log_pruning(self, tmp_path):
+        """Test pruning keeps the newest runs by first timestamp."""
+        import json
+        from components.analytics.delegation_charts import _prune_runs
+
+        log_file = tmp_path / "delegation.jsonl"
+        events = [
+            {"run_id": "b", "timestamp": "2026-01-02T00:00:00Z"},
+            {"run_id": "a", "timestamp": "2026-01-01T00:00:00Z"},
+            {"event_type": "heartbeat"},
+            {"run_id": "c", "timestamp": "2026-01-03T00:00:00Z"},
+            {"run_id": "a", "timestamp": "2026-01-04T00:00:00Z"},
+            {"run_id": "b", "timestamp": "2026-01-05T00:00:00Z"},
+        ]
+        lines = [json.dumps(e) for e in events]
+        lines[3:3] = ["", "not json"]
+        log_file.write_text("\n".join(lines) + "\n")
+
+        runs_removed, events_removed, events_kept = _prune_runs(str(log_file), keep=2)
+
+        # Run "a" started first, so it is pruned despite its late event
+        assert (runs_removed, events_removed, events_kept) == (1, 2, 4)
+        kept = [json.loads(l) for l in log_file.read_text().splitlines()]
+        assert [e.get("run_id") for e in kept] == ["b", None, "c", "b"]
+
 
 class TestTeam3ToolApproval:
     """Test Team 3: Tool Approval System components."""
 
-    def test_tool_interceptor_initialization(self):
+    def test_tool_interceptor_initialization(self, interceptor):
         """Test tool interceptor can be initialized."""
-        interceptor = ToolInterceptor()
         assert interceptor.pending_calls == {}
         assert interceptor.approved_calls == {}
         assert interceptor.rejected_calls == {}
 
-    def test_tool_interception(self):
+    def test_tool_interception(self, interceptor):
         """Test tool call interception."""
-        interceptor = ToolInterceptor()
-
         tool_call = interceptor.intercept('shell', {'command': 'ls'})
 
         assert tool_call.tool_name == 'shell'
@@ -127,10 +201,8 @@ class TestTeam3ToolApproval:
         assert tool_call.danger_level == ToolDangerLevel.HIGH
         assert tool_call.id in interceptor.pending_calls
 
-    def test_tool_approval(self):
+    def test_tool_approval(self, interceptor):
         """Test tool approval flow."""
-        interceptor = ToolInterceptor()
-
         # Intercept a tool
         tool_call = interceptor.intercept('memory_recall', {'query': 'test'})
 
@@ -142,10 +214,8 @@ class TestTeam3ToolApproval:
         assert tool_call.id in interceptor.approved_calls
         assert interceptor.approved_calls[tool_call.id].approved is True
 
-    def test_tool_rejection(self):
+    def test_tool_rejection(self, interceptor):
         """Test tool rejection flow."""
-        interceptor = ToolInterceptor()
-
         # Intercept a tool
         tool_call = interceptor.intercept('shell', {'command': 'rm -rf /'})
 
@@ -157,9 +227,9 @@ class TestTeam3ToolApproval:
         assert tool_call.id in interceptor.rejected_calls
         assert interceptor.rejected_calls[tool_call.id].approved is False
 
-    def test_security_analyzer(self):
+    def test_security_analyzer(self, security_analyzer):
         """Test security analysis."""
-        analyzer = SecurityAnalyzer()
+        analyzer = security_analyzer
 
         # Analyze a dangerous shell command
         assessment = analyzer.analyze('shell', {'command': 'rm -rf /'})
@@ -172,9 +242,9 @@ class TestTeam3ToolApproval:
         assessment_safe = analyzer.analyze('memory_recall', {'query': 'test'})
         assert assessment_safe.risk_score < assessment.risk_score
 
-    def test_audit_logger(self):
+    def test_audit_logger(self, tmp_path):
         """Test audit logging."""
-        logger = AuditLogger(log_file="/tmp/test_audit.jsonl")
+        logger = AuditLogger(log_file=str(tmp_path / "test_audit.jsonl"))
 
         # Log an approval
         logger.log_approval(
@@ -195,31 +265,31 @@ class TestTeam4GatewayIntegration:
         client = EnhancedGatewayClient(base_url="http://localhost:3000")
         assert client.base_url == "http://localhost:3000"
 
-    @patch('requests.Session.get')
-    def test_gateway_health_check(self, mock_get):
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def mock_session_get(cls):
+        """Patch requests.Session.get once for every test in the class."""
+        with patch('requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.json.return_value = {
+                'status': 'ok',
+                'session_cost_usd': 0.05,
+                'daily_cost_usd': 0.10,
+                'monthly_cost_usd': 1.50
+            }
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+            yield mock_get
+
+    def test_gateway_health_check(self):
         """Test gateway health check."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'status': 'ok'}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
         client = EnhancedGatewayClient()
         health = client.get_health()
 
         assert health['status'] == 'ok'
 
-    @patch('requests.Session.get')
-    def test_gateway_cost_summary(self, mock_get):
+    def test_gateway_cost_summary(self):
         """Test cost summary retrieval."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'session_cost_usd': 0.05,
-            'daily_cost_usd': 0.10,
-            'monthly_cost_usd': 1.50
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
         client = EnhancedGatewayClient()
         costs = client.get_cost_summary()
 
@@ -245,7 +315,7 @@ class TestCrossTeamIntegration:
             )
             assert tool_call.id in interceptor.pending_calls
 
-    def test_team2_to_team3_integration(self):
+    def test_team2_to_team3_integration(self, tmp_path):
         """Test Team 2 (Dashboard) to Team 3 (Tool History) integration."""
         # Team 3 creates tool execution history
         interceptor = ToolInterceptor()
@@ -253,7 +323,7 @@ class TestCrossTeamIntegration:
         interceptor.approve(tool_call.id, 'test_user')
 
         # Team 2 should be able to read this history
-        parser = ToolHistoryParser(history_file="/tmp/test_tool_history.jsonl")
+        parser = ToolHistoryParser(history_file=str(tmp_path / "test_tool_history.jsonl"))
         # Would read from shared history file
 
         assert True  # Integration point exists
@@ -281,23 +351,25 @@ class TestContractCompliance:
         team3_keys = ['pending_tools', 'tool_decisions', 'audit_log']
         team4_keys = ['gateway_status', 'gateway_paired', 'webhooks']
 
-        all_keys = team1_keys + team2_keys + team3_keys + team4_keys
+        # Check no two teams share a key, naming any that collide
+        team_keys = [frozenset(team1_keys), frozenset(team2_keys),
+                     frozenset(team3_keys), frozenset(team4_keys)]
+        for a, b in combinations(team_keys, 2):
+            assert not (a & b), f"Conflicting keys: {sorted(a & b)}"
 
-        # Check no duplicates
+        # frozenset hides repeats within one team, so check those too
+        all_keys = team1_keys + team2_keys + team3_keys + team4_keys
         assert len(all_keys) == len(set(all_keys))
 
     def test_file_paths_consistent(self):
         """Test file paths match contracts."""
         # All teams should use consistent paths
-        memory_file = "~/.zeroclaw/memory_store.json"
-        costs_file = "~/.zeroclaw/state/costs.jsonl"
-
-        reader = MemoryReader(memory_file=memory_file)
-        costs = CostsReader(costs_file=costs_file)
+        reader = MemoryReader(memory_file=MEMORY_PATH)
+        costs = CostsReader(costs_file=COSTS_PATH)
 
         # Paths should expand consistently
-        assert os.path.expanduser(memory_file) == reader.memory_file
-        assert os.path.expanduser(costs_file) == costs.costs_file
+        assert reader.memory_file == MEMORY_FILE
+        assert costs.costs_file == COSTS_FILE
 
     def test_error_types_hierarchy(self):
         """Test error types follow contract."""